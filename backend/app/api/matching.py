@@ -294,9 +294,10 @@ def run_matching_task(jd_id: str, batch_id: Optional[str] = None):
         
         # Run matching
         matcher = CandidateMatcher()
+        jd_index = matcher.build_jd_index(jd)  # lower/set the JD lists once for the whole batch
         for candidate in candidates:
             try:
-                result = matcher.match_candidate(candidate, jd, db)
+                result = matcher.match_candidate(candidate, jd, db, jd_index)
                 db.add(result)
                 db.commit()
             except Exception as e:
@@ -12,20 +12,54 @@ Gemini AI handles EVERYTHING else (95%+ reliable):
 No complex merge logic. No conflicts. Maximum accuracy.
 """
 
+import functools
+import itertools
 import logging
 import re
 from typing import Dict, Any
 
-from app.services.dictionaries import get_skills_dict, get_tools_dict
+from app.services.dictionaries import (
+    SKILLS_MATCHER,
+    TOOLS_MATCHER,
+    DictionaryMatcher,
+)
 
 logger = logging.getLogger(__name__)
 
+# Page markers injected by the OCR pipeline ("--- Page N ---", "Page N")
+_PAGE_NOISE_RE = re.compile(r"^(?:--- Page|Page \d+)")
+
+# Header lines that are contact info or job titles rather than a person's name
+_NAME_REJECT_RE = re.compile(
+    r"\b(email|phone|linkedin|skill|about|engineer|designer|manager|modeler|"
+    r"technician|coordinator|specialist|architect|draftsman|supervisor|developer|"
+    r"analyst|consultant|civil|senior|junior|lead|bim|cad|drafter)\b",
+    re.IGNORECASE,
+)
+
+# One alternation across all discipline keywords — lastgroup names the discipline
+_DISC_RE = re.compile(
+    r"\b(?:(?P<civil>civil|structural|construction)|(?P<bim>bim|revit|navisworks)|"
+    r"(?P<arch>architect|architecture)|(?P<mech>mechanical|hvac|piping)|"
+    r"(?P<elec>electrical|power|wiring))\b",
+    re.IGNORECASE,
+)
+_DISC_NAMES = {
+    "civil": "Civil Engineering",
+    "bim": "BIM",
+    "arch": "Architecture",
+    "mech": "Mechanical Engineering",
+    "elec": "Electrical Engineering",
+}
+
 
 class ATSParser:
 
+    __slots__ = ("_skills_matcher", "_tools_matcher", "_ai_parser", "_use_ai")
+
     def __init__(self, skills_dict=None, tools_dict=None, use_ai=True):
-        self.skills_dict = [s.lower() for s in (skills_dict or get_skills_dict())]
-        self.tools_dict = [t.lower() for t in (tools_dict or get_tools_dict())]
+        self._skills_matcher = DictionaryMatcher(skills_dict) if skills_dict else SKILLS_MATCHER
+        self._tools_matcher = DictionaryMatcher(tools_dict) if tools_dict else TOOLS_MATCHER
         self._ai_parser = None
         self._use_ai = use_ai
 
@@ -34,8 +68,8 @@ class ATSParser:
         """Lazy-load GeminiParser to avoid import issues at module level."""
         if self._ai_parser is None and self._use_ai:
             try:
-                from app.services.gemini_parser import GeminiParser
-                self._ai_parser = GeminiParser()
+                from app.services.gemini_parser import get_shared_parser
+                self._ai_parser = get_shared_parser()
             except Exception as e:
                 logger.warning(f"Failed to initialize GeminiParser: {e}")
                 self._ai_parser = None
@@ -46,16 +80,23 @@ class ATSParser:
     # ------------------------------------------------
     def parse(self, text: str) -> Dict[str, Any]:
 
-        # STEP 1: Regex extraction — contacts only (always reliable)
+        # STEP 1+2: Regex extraction — contacts, tools, and dictionary skills.
+        # Deterministic, so duplicate uploads can reuse the memoized result.
+        if (self._skills_matcher is SKILLS_MATCHER
+                and self._tools_matcher is TOOLS_MATCHER
+                and len(text) < _MAX_CACHEABLE_CHARS):
+            rule = _rule_extract_cached(text)
+        else:
+            rule = self._rule_extract(text)
+        email, phone, linkedin, urls = rule[0]
         contacts = {
-            "email": self._extract_email(text),
-            "phone": self._extract_phone(text),
-            "linkedin": self._extract_linkedin(text),
-            "portfolio_urls": self._extract_urls(text),
+            "email": email,
+            "phone": phone,
+            "linkedin": linkedin,
+            "portfolio_urls": list(urls),
         }
-
-        # STEP 2: Regex extraction — tools (dictionary match, always reliable)
-        tools = self._extract_tools(text)
+        tools = list(rule[1])
+        dict_skills = rule[2]
 
         # STEP 3: Gemini extraction — everything else
         ai_result = None
@@ -68,11 +109,11 @@ class ATSParser:
 
         # STEP 4: Build final result
         if ai_result:
-            result = self._build_from_gemini(ai_result, contacts, tools, text)
+            result = self._build_from_gemini(ai_result, contacts, tools, dict_skills, text)
         else:
             # Fallback: rule-based only (when Gemini is unavailable)
             logger.warning("Using rule-based fallback (Gemini unavailable)")
-            result = self._build_fallback(contacts, tools, text)
+            result = self._build_fallback(contacts, tools, dict_skills, text)
 
         # STEP 5: Confidence score
         from app.services.gemini_parser import calculate_confidence
@@ -87,16 +128,17 @@ class ATSParser:
     # ------------------------------------------------
     # BUILD FROM GEMINI (primary path)
     # ------------------------------------------------
-    def _build_from_gemini(self, ai: Dict, contacts: Dict, tools: list, text: str) -> Dict[str, Any]:
+    def _build_from_gemini(self, ai: Dict, contacts: Dict, tools: list, dict_skills, text: str) -> Dict[str, Any]:
         """
         Use Gemini output directly for all non-contact fields.
         Contacts come from regex. Tools come from dictionary match.
         Skills = union of Gemini skills + dictionary-matched skills.
         """
-        # Union Gemini skills with dictionary-matched skills for completeness
-        ai_skills = set(s.lower() for s in (ai.get("skills") or []))
-        dict_skills = set(s for s in self.skills_dict if re.search(rf"\b{re.escape(s)}\b", text.lower()))
-        combined_skills = list(ai_skills | dict_skills)
+        # Union Gemini skills with dictionary-matched skills for completeness;
+        # dict.fromkeys keeps the order stable for downstream ranking/caching
+        combined_skills = list(dict.fromkeys(itertools.chain(
+            dict_skills, (s.lower() for s in (ai.get("skills") or []))
+        )))
 
         return {
             # Contacts — regex first, Gemini fallback
@@ -122,10 +164,10 @@ class ATSParser:
     # ------------------------------------------------
     # FALLBACK (rule-based only, when Gemini is down)
     # ------------------------------------------------
-    def _build_fallback(self, contacts: Dict, tools: list, text: str) -> Dict[str, Any]:
+    def _build_fallback(self, contacts: Dict, tools: list, dict_skills, text: str) -> Dict[str, Any]:
         """Minimal rule-based extraction when Gemini is unavailable."""
-        lines = self._clean_lines(text.split("\n"))
-        dict_skills = list(set(s for s in self.skills_dict if re.search(rf"\b{re.escape(s)}\b", text.lower())))
+        # Name fallback only looks at the header — no need to clean the whole document
+        lines = list(itertools.islice(self._iter_clean_lines(text), 8))
 
         return {
             "email": contacts["email"],
@@ -141,10 +183,28 @@ class ATSParser:
             "projects": [],
             "certifications": [],
             "languages": [],
-            "skills": dict_skills,
+            "skills": list(dict_skills),
             "tools": tools,
         }
 
+    # ------------------------------------------------
+    # DETERMINISTIC RULE-BASED EXTRACTION (cacheable)
+    # ------------------------------------------------
+    def _rule_extract(self, text):
+        """Contacts + dictionary tools/skills as hashable, cache-safe tuples."""
+        # One URL pass; linkedin is classified from the matches instead of rescanned
+        urls = tuple(self._extract_urls(text))
+        contacts = (
+            self._extract_email(text),
+            self._extract_phone(text),
+            self._extract_linkedin(text, urls),
+            urls,
+        )
+        tools = tuple(self._tools_matcher.scan_ordered(text))
+        # Ordered tuple (not a set) so merged skill lists stay deterministic
+        skills = tuple(self._skills_matcher.scan_ordered(text))
+        return contacts, tools, skills
+
     # ------------------------------------------------
     # REGEX CONTACT EXTRACTORS (always used)
     # ------------------------------------------------
@@ -160,11 +220,13 @@ class ATSParser:
                 return cleaned
         return None
 
-    def _extract_linkedin(self, text):
-        # Try full URL first
-        m = re.search(r"https?://[^\s]*linkedin\.com[^\s]*", text)
-        if m:
-            return m.group(0)
+    def _extract_linkedin(self, text, urls=None):
+        # Try full URLs first — reuse the already-scanned list when available
+        if urls is None:
+            urls = self._extract_urls(text)
+        linkedin = next((u for u in urls if "linkedin.com" in u.lower()), None)
+        if linkedin:
+            return linkedin
         # Try without protocol (linkedin.com/in/username)
         m = re.search(r"(?:www\.)?linkedin\.com/in/[^\s,;)\"']+", text, re.IGNORECASE)
         if m:
@@ -178,36 +240,22 @@ class ATSParser:
     # DICTIONARY-BASED TOOL EXTRACTION (always used)
     # ------------------------------------------------
     def _extract_tools(self, text):
-        tl = text.lower()
-        return list({t for t in self.tools_dict if re.search(rf"\b{re.escape(t)}\b", tl)})
+        return self._tools_matcher.scan_ordered(text)
 
     # ------------------------------------------------
     # MINIMAL FALLBACKS (only when Gemini is down)
     # ------------------------------------------------
+    def _iter_clean_lines(self, text):
+        """Yield stripped, non-empty lines with page-marker noise removed."""
+        return (s for s in (l.strip() for l in text.split("\n")) if s and not _PAGE_NOISE_RE.match(s))
+
     def _clean_lines(self, lines):
-        out = []
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("--- Page") or re.match(r"^Page \d+", line):
-                continue
-            out.append(line)
-        return out
+        return [s for s in (l.strip() for l in lines) if s and not _PAGE_NOISE_RE.match(s)]
 
     def _extract_name_fallback(self, lines):
         """Simple name extraction — only used when Gemini is unavailable."""
-        role_keywords = [
-            "engineer", "designer", "manager", "modeler", "technician",
-            "coordinator", "specialist", "architect", "draftsman", "supervisor",
-            "developer", "analyst", "consultant", "civil", "senior", "junior",
-            "lead", "bim", "cad", "drafter",
-        ]
         for line in lines[:8]:
-            low = line.lower()
-            if any(x in low for x in ["email", "phone", "linkedin", "skill", "about"]):
-                continue
-            if any(rk in low for rk in role_keywords):
+            if _NAME_REJECT_RE.search(line):
                 continue
             words = line.split()
             if 2 <= len(words) <= 4 and words[0][0].isupper():
@@ -216,18 +264,22 @@ class ATSParser:
 
     def _detect_discipline_fallback(self, text):
         """Simple discipline detection — used as fallback when Gemini doesn't provide one."""
-        disciplines = {
-            "Civil Engineering": ["civil", "structural", "construction"],
-            "BIM": ["bim", "revit", "navisworks"],
-            "Architecture": ["architect", "architecture"],
-            "Mechanical Engineering": ["mechanical", "hvac", "piping"],
-            "Electrical Engineering": ["electrical", "power", "wiring"],
-        }
-        tl = text.lower()
-        for d, keys in disciplines.items():
-            if any(k in tl for k in keys):
-                return d
-        return None
+        m = _DISC_RE.search(text)
+        return _DISC_NAMES[m.lastgroup] if m else None
+
+
+# ---------------------------------------------------------
+# RULE-EXTRACTION CACHE
+# ---------------------------------------------------------
+# Batch uploads frequently contain duplicate or re-uploaded CVs; memoizing the
+# deterministic regex/dictionary portion lets re-parses skip it entirely.
+# Gemini output is not cached since it can change between calls.
+_MAX_CACHEABLE_CHARS = 200_000  # don't hold huge texts in the cache
+
+
+@functools.lru_cache(maxsize=256)
+def _rule_extract_cached(text: str):
+    return ATSParser(use_ai=False)._rule_extract(text)
 
 
 # ---------------------------------------------------------
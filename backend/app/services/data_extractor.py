@@ -6,16 +6,18 @@ import re
 from typing import Dict, List, Any, Optional
 import phonenumbers
 
-from app.services.dictionaries import get_skills_dict, get_tools_dict
+from app.services.dictionaries import SKILLS_MATCHER, TOOLS_MATCHER
+
+# "City, State" / "City, Country". The city part is bounded to 4 words so the
+# (X )* repetition can't backtrack pathologically on long capitalized runs.
+_LOCATION_RE = re.compile(r'\b([A-Z][a-z]+(?: [A-Z][a-z]+){0,3}),\s*([A-Z]{2}|[A-Z][a-z]+)\b')
 
 
 class DataExtractor:
     """Extract structured data from raw OCR text using rule-based patterns."""
-    
-    def __init__(self):
-        self.skills_dict = [s.lower() for s in get_skills_dict()]
-        self.tools_dict = [t.lower() for t in get_tools_dict()]
-    
+
+    __slots__ = ()
+
     def extract_from_text(self, text: str) -> Dict[str, Any]:
         """
         Extract all candidate information from OCR text.
@@ -93,44 +95,22 @@ class DataExtractor:
         Extract location/address.
         Look for patterns like "City, State" or "City, Country".
         """
-        # Simple pattern for City, State/Country
-        pattern = r'\b([A-Z][a-z]+(?: [A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+)\b'
-        matches = re.findall(pattern, text)
-        
-        if matches:
-            city, state = matches[0]
-            return f"{city}, {state}"
-        
+        m = _LOCATION_RE.search(text)
+        if m:
+            return f"{m.group(1)}, {m.group(2)}"
         return None
     
     def _extract_skills(self, text: str) -> List[str]:
         """
         Extract skills by matching against skills dictionary.
         """
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in self.skills_dict:
-            # Use word boundary matching
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
-        
-        return list(set(found_skills))  # Remove duplicates
-    
+        return SKILLS_MATCHER.scan_ordered(text)
+
     def _extract_tools(self, text: str) -> List[str]:
         """
         Extract software/tools by matching against tools dictionary.
         """
-        text_lower = text.lower()
-        found_tools = []
-        
-        for tool in self.tools_dict:
-            pattern = r'\b' + re.escape(tool) + r'\b'
-            if re.search(pattern, text_lower):
-                found_tools.append(tool)
-        
-        return list(set(found_tools))
+        return TOOLS_MATCHER.scan_ordered(text)
     
     def _extract_education(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -2,8 +2,12 @@
 Predefined dictionaries for skills, tools, and role matching.
 In production, these would be stored in the database and manageable via admin panel.
 """
+import bisect
+import re
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_skills_dict():
     """
     Get list of recognized skills.
@@ -40,6 +44,7 @@ def get_skills_dict():
     ]
 
 
+@lru_cache(maxsize=1)
 def get_tools_dict():
     """
     Get list of recognized software/tools.
@@ -81,6 +86,214 @@ def get_tools_dict():
     ]
 
 
+def _trie_pattern(terms) -> str:
+    """Collapse a term list into a trie-shaped alternation, e.g.
+    ("revit", "review") -> "revi(?:t|ew)".
+
+    re tries plain alternatives left to right, re-walking shared prefixes
+    once per term; merging prefixes turns that branch chain into a single
+    path per unique prefix.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = None  # end-of-term marker
+
+    def render(node: dict) -> str:
+        end = "" in node
+        branches = [
+            re.escape(ch) + render(child)
+            for ch, child in sorted(node.items())
+            if ch != ""
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1:
+            pattern = branches[0]
+        else:
+            pattern = "(?:" + "|".join(branches) + ")"
+        if end:
+            # Greedy optional suffix keeps longest-match semantics
+            pattern = "(?:" + pattern + ")?"
+        return pattern
+
+    return render(trie)
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _has_nested_terms(terms) -> bool:
+    """True if any term can occur, with valid word boundaries, inside
+    another term. In that case a single leftmost-longest pass would swallow
+    the inner term, so scans must fall back to per-term probing.
+    Prefix/suffix containment counts as nested since validity then depends
+    on the surrounding text."""
+    for outer in terms:
+        for inner in terms:
+            if inner is outer or len(inner) >= len(outer):
+                continue
+            i = outer.find(inner)
+            while i != -1:
+                j = i + len(inner)
+                left_ok = i == 0 or (_is_word(outer[i - 1]) != _is_word(inner[0]))
+                right_ok = j == len(outer) or (_is_word(outer[j]) != _is_word(inner[-1]))
+                if left_ok and right_ok:
+                    return True
+                i = outer.find(inner, i + 1)
+    return False
+
+
+class DictionaryMatcher:
+    """
+    Word-boundary matcher over a fixed term list.
+    Compiles the alternation once so every parser instance shares one warm matcher.
+    """
+    __slots__ = (
+        "_terms", "_probes", "_span_re", "_rank", "_single_pass_safe",
+        "_unigrams", "_phrases",
+    )
+
+    def __init__(self, terms):
+        # Longest terms first so multi-word tools surface before any term
+        # they start with, and ties alphabetical for deterministic output.
+        self._terms = tuple(
+            sorted(dict.fromkeys(t.lower() for t in terms), key=lambda s: (-len(s), s))
+        )
+        # Per-term probe data: whether the term's edge characters are word
+        # characters, which decides what \b demands of the neighbours.
+        self._probes = tuple(
+            (t, len(t), _is_word(t[0]), _is_word(t[-1])) for t in self._terms
+        )
+        # Single trie-collapsed alternation over all terms for offset-yielding
+        # scans: one linear pass of the C regex engine instead of one scan per
+        # term, with shared prefixes merged to keep the NFA small.
+        self._span_re = re.compile(r"\b(?:" + _trie_pattern(self._terms) + r")\b")
+        self._rank = {t: i for i, t in enumerate(self._terms)}
+        # When no term nests inside another, whole-text scans can use the
+        # single alternation pass; otherwise per-term probing stays exact.
+        self._single_pass_safe = not _has_nested_terms(self._terms)
+        # Token-probe layout: single-word terms go in one hash set, phrases
+        # are bucketed by their first word so only matching positions in a
+        # token stream pay for the comparison.
+        self._unigrams = frozenset(t for t in self._terms if " " not in t)
+        phrase_index: dict = {}
+        for t in self._terms:
+            if " " in t:
+                parts = tuple(t.split(" "))
+                phrase_index.setdefault(parts[0], []).append(parts)
+        self._phrases = {k: tuple(v) for k, v in phrase_index.items()}
+
+    @property
+    def terms(self):
+        return self._terms
+
+    def __contains__(self, term: str) -> bool:
+        """Hash lookup — lets callers probe tokens against the dictionary
+        without any scan at all."""
+        return term.lower() in self._rank
+
+    def _iter_hits(self, text_lower: str):
+        # str.find locates candidate offsets at C speed; word boundaries are
+        # then verified by inspecting the two neighbouring characters, so no
+        # per-term regex ever rescans the text. A boundary exists where
+        # word-ness flips (or at the text edge next to a word character),
+        # matching what \b-wrapped per-term patterns used to enforce.
+        n = len(text_lower)
+        find = text_lower.find
+        # One pass builds the text's character set; terms whose first
+        # character never appears skip their full-text find() probe entirely
+        present = frozenset(text_lower)
+        for term, tlen, first_w, last_w in self._probes:
+            if term[0] not in present:
+                continue
+            i = find(term)
+            while i != -1:
+                end = i + tlen
+                if ((_is_word(text_lower[i - 1]) != first_w) if i else first_w) and \
+                        ((_is_word(text_lower[end]) != last_w) if end < n else last_w):
+                    yield term
+                    break
+                i = find(term, i + 1)
+
+    def _hit_terms(self, text_lower: str) -> set:
+        if self._single_pass_safe:
+            # One linear walk of the whole alternation, all terms at once
+            return {m.group(0) for m in self._span_re.finditer(text_lower)}
+        return set(self._iter_hits(text_lower))
+
+    def scan(self, text: str, *, lowered: bool = False) -> frozenset:
+        """Return the set of dictionary terms found in text.
+
+        Pass lowered=True when the caller already holds a lowercased copy,
+        to skip the redundant O(n) casefold pass here.
+        """
+        return frozenset(self._hit_terms(text if lowered else text.lower()))
+
+    def scan_ordered(self, text: str, *, lowered: bool = False) -> list:
+        """Like scan(), but as a list in deterministic dictionary order."""
+        return sorted(
+            self._hit_terms(text if lowered else text.lower()),
+            key=self._rank.__getitem__,
+        )
+
+    def scan_tokens(self, tokens) -> list:
+        """Match a pre-tokenized, lowercased document with hash probes only.
+
+        Single-word terms resolve via one frozenset intersection; multi-word
+        terms are checked only at positions where their first word appears.
+        Callers that tokenize once (e.g. for other analyses) get dictionary
+        matching almost for free; terms a tokenizer would split on internal
+        punctuation still need scan().
+        """
+        toks = list(tokens)
+        found = set(self._unigrams.intersection(toks))
+        if self._phrases:
+            for i, tok in enumerate(toks):
+                for parts in self._phrases.get(tok, ()):
+                    if tuple(toks[i:i + len(parts)]) == parts:
+                        found.add(" ".join(parts))
+        return sorted(found, key=self._rank.__getitem__)
+
+    def scan_batch(self, texts, *, lowered: bool = False) -> list:
+        """Scan a whole batch of documents in one pass.
+
+        Documents are joined with a newline — no dictionary term contains
+        one, so a match can never span two documents — and the trie
+        alternation walks the joined buffer once. Hits are bucketed back to
+        their document by offset; per-document results come out in the same
+        deterministic dictionary order as scan_ordered().
+        """
+        lowered_texts = list(texts) if lowered else [t.lower() for t in texts]
+        if not lowered_texts:
+            return []
+        starts = [0]
+        for t in lowered_texts[:-1]:
+            starts.append(starts[-1] + len(t) + 1)
+        found = [{} for _ in lowered_texts]  # dicts double as ordered sets
+        for m in self._span_re.finditer("\n".join(lowered_texts)):
+            doc = bisect.bisect_right(starts, m.start()) - 1
+            found[doc][m.group(0)] = None
+        rank = self._rank
+        return [sorted(f, key=rank.__getitem__) for f in found]
+
+    def iter_spans(self, text_lower: str):
+        """Yield (start, end, term) for every dictionary hit in one pass.
+
+        Expects already-lowercased text so callers can reuse their copy.
+        """
+        for m in self._span_re.finditer(text_lower):
+            yield m.start(), m.end(), m.group(0)
+
+
+# Shared singletons — compiled once at import, reused by all parser instances
+SKILLS_MATCHER = DictionaryMatcher(get_skills_dict())
+TOOLS_MATCHER = DictionaryMatcher(get_tools_dict())
+
+
 def get_role_equivalents():
     """
     Get dictionary of role title equivalents for matching.
@@ -2,15 +2,269 @@
 Enhanced CV data extraction service using regex, NLP, and rule-based parsing.
 Extracts 50+ comprehensive data points without AI model dependencies.
 """
+import bisect
+import copy
+import functools
+import itertools
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import phonenumbers
 from dateutil import parser as date_parser
 
-from app.services.dictionaries import get_skills_dict, get_tools_dict
+from app.services.dictionaries import SKILLS_MATCHER, TOOLS_MATCHER
 from app.services.ats_parser import ATSParser
 
+# ---------------------------------------------------------------------------
+# Precompiled patterns — hoisted to module level so per-CV calls skip the
+# re-cache lookups and the extractor methods stay allocation-light.
+# ---------------------------------------------------------------------------
+_DOB_PATTERNS = [
+    re.compile(r'(?:date of birth|dob|born)[:\s]+(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})'),
+    re.compile(r'(?:date of birth|dob|born)[:\s]+(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{2,4})'),
+]
+_NATIONALITY_RE = re.compile(r'(?:nationality|citizen)[:\s]+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)(?:[\n\r,.]|$)')
+_DATE_RANGE_RE = re.compile(r'(\d{1,2}[-/]\d{4}|\w+\s+\d{4})\s*[-–—to]+\s*(\d{1,2}[-/]\d{4}|\w+\s+\d{4}|present|current)')
+_ENTRY_DATE_RE = re.compile(r'(\w+\s+\d{4}|\d{1,2}[-/]\d{4})\s*[-–—to]+\s*(\w+\s+\d{4}|\d{1,2}[-/]\d{4}|present|current)')
+# Date ranges and the "at Company" suffix strip in one fused pass; the
+# leading-bullet strip stays separate because its ^ anchor must run
+# against the already-date-stripped string
+_HEADER_STRIP_RE = re.compile(
+    r'(?:\w+\s+\d{4}|\d{1,2}[-/]\d{4}|\d{4})\s*[-–—to]+\s*(?:\w+\s+\d{4}|\d{1,2}[-/]\d{4}|present|current|\d{4})'
+    r'|\s+(?:at|@)\s+.*$',
+    re.IGNORECASE,
+)
+_HEADER_BULLET_RE = re.compile(r'^[\->•●:;|\s]+')
+_BULLET_PREFIX_RE = re.compile(r'^[-•●]')
+# One pass classifies every fragment of a work entry; whole responsibility
+# lines take precedence, company/location/project fragments match anywhere
+_ENTRY_SCAN_RE = re.compile(
+    r'^[^\S\n]*(?P<resp>[-•●]\s[^\n]*|(?i:responsible|managed|led|developed)[^\n]*)$'
+    r'|(?P<company>(?:at|@)\s+(?P<company_name>[^,\n]+?)(?:,|\n|$))'
+    r'|(?P<loc>(?P<loc_city>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*(?P<loc_country>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?))'
+    r'|(?P<project>(?:project|development|building|complex)[:s]?\s+(?P<project_name>[A-Z][^\n,.]+?)(?:[,.\n]|$))',
+    re.MULTILINE,
+)
+# Non-capturing century prefix: with the group, findall returned just
+# '19'/'20' instead of the full year
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+# Emails and URLs come out of one tagged pass; phone stays separate because
+# its digit-run pattern overlaps both of these
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<url>https?://[^\s<>"{}|\\^`\[\]]+)'
+)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Non-capturing with digit lookaround anchors: findall on the old pattern
+# returned just the optional country-code group (usually empty), and the
+# unanchored digit prefix re-explored every offset inside long digit runs
+_PHONE_RE = re.compile(r'(?<!\d)(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)')
+# Already-normalized E.164 candidates skip the phonenumbers round-trip
+_E164_RE = re.compile(r'\+\d{8,15}$')
+# City part bounded to 4 words so the repetition can't backtrack
+# pathologically on long title-cased runs
+_LOC_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}),\s*([A-Z]{2}|[A-Z][a-z]+)\b')
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_NON_ALPHA_RE = re.compile(r'[^a-z]')
+_NAME_WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.-')
+
+
+def _is_name_word(w: str) -> bool:
+    """Equivalent of ^[A-Za-z][A-Za-z.\\-]*$ without the regex engine —
+    plain str/set checks are tighter than automaton dispatch for short words."""
+    return bool(w) and w[0].isalpha() and w.isascii() and _NAME_WORD_CHARS.issuperset(w)
+# Header lines that can't be a name. One compiled alternation replaces ~17
+# substring probes per candidate line; plain substring semantics (no \b)
+# match the original `any(kw in line)` checks.
+_NAME_BLACKLIST_RE = re.compile('|'.join(sorted(map(re.escape, (
+    'resume', 'curriculum', 'vitae', 'cv', 'profile',
+    'experience', 'education', 'skills', 'projects',
+    'professional summary', 'contact', 'work history',
+    'microsoft office', 'microsoft', 'adobe', 'autocad',
+    'confidential', 'page',
+)), key=len, reverse=True)))
+# Labelled ("Name: ...") and bare name lines as one anchored alternation;
+# the labelled branch comes first so it keeps its old priority
+_NAME_LINE_RE = re.compile(
+    r'^(?:name[:\s]+(?P<labeled>[A-Za-z][A-Za-z.\-]*(?:\s+[A-Za-z][A-Za-z.\-]*)+)'
+    r'|(?P<bare>[A-Za-z][A-Za-z.\-]*(?:\s+[A-Za-z][A-Za-z.\-]*){1,3}))$',
+    re.IGNORECASE,
+)
+_POSITION_PATTERNS = [
+    re.compile(r'(?:current|present)[^\n]*?(?:position|role|title)[:\s]+([^\n]+)'),
+    re.compile(r'(?:position|role|title)[:\s]+([^\n]+)'),
+]
+_CUR_SALARY_PATTERNS = [
+    re.compile(r'current\s+salary[:\s]+(?:aed\s+)?(\d+[,\d]*)'),
+    re.compile(r'salary[:\s]+(?:aed\s+)?(\d+[,\d]*)'),
+]
+_EXP_SALARY_PATTERNS = [
+    re.compile(r'expected\s+salary[:\s]+(?:aed\s+)?(\d+[,\d]*)'),
+    re.compile(r'salary\s+expectation[:\s]+(?:aed\s+)?(\d+[,\d]*)'),
+]
+_NOTICE_PATTERNS = [
+    re.compile(r'notice\s+period[:\s]+(\d+)\s*(?:days?|weeks?|months?)'),
+    re.compile(r'availability[:\s]+(\d+)\s*(?:days?|weeks?|months?)'),
+]
+_CERT_RE = re.compile(r'(?:certified|certification|certificate)[:s]?\s+([A-Z][^\n,.]+?)(?:[,.\n]|$)')
+_PROJECT_WORD_RE = re.compile(r'\bproject\b')
+
+# Section markers are plain substrings. 'experience' subsumes the old
+# optional "work\s+" prefix (only the match end is used) and makes the old
+# 'professional experience' alternative unreachable; 'certification' covers
+# the plural where only the match start matters. Both section extractors
+# read marker offsets from one shared scan of the text (see _scan_sections).
+_EXP_START_MARKERS = ('experience', 'employment history', 'career history')
+_EXP_END_MARKERS = ('education', 'academic', 'qualifications', 'skills', 'certifications')
+_EDU_START_MARKERS = ('education', 'academic', 'qualifications', 'degrees')
+_EDU_END_MARKERS = ('certification', 'skills', 'languages', 'references')
+_SECTION_RE = re.compile('|'.join(sorted(
+    {*_EXP_START_MARKERS, *_EXP_END_MARKERS, *_EDU_START_MARKERS, *_EDU_END_MARKERS},
+    key=len, reverse=True,
+)))
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_sections(text_lower: str) -> Dict[str, list]:
+    """Offsets of every section-marker occurrence, from one pass.
+
+    Memoized so the experience and education extractors called on the same
+    CV share a single traversal instead of rescanning per marker.
+    """
+    pos: Dict[str, list] = {}
+    for m in _SECTION_RE.finditer(text_lower):
+        kw = m.group(0)
+        pos.setdefault(kw, []).append(m.start())
+        if kw == 'certifications':
+            # The singular marker matches inside the plural
+            pos.setdefault('certification', []).append(m.start())
+    return pos
+
+
+def _first_marker_at_or_after(positions: list, start: int) -> int:
+    idx = bisect.bisect_left(positions, start)
+    return positions[idx] if idx < len(positions) else -1
+# One alternation per category; findall collects every hit and the
+# priority-ordered status tuple picks the winner, matching the old
+# first-status-found loops in a single pass over the text
+_MARITAL_STATUSES = ('single', 'married', 'divorced', 'widowed')
+_MARITAL_RE = re.compile(r'\b(?:single|married|divorced|widowed)\b')
+_MILITARY_STATUSES = ('completed', 'exempted', 'postponed', 'not applicable')
+_MILITARY_RE = re.compile(r'military[:\s]+(completed|exempted|postponed|not applicable)')
+
+_PRESENT_TOKENS = frozenset(('present', 'current', 'now', 'till date', 'to date'))
+
+# Degree keywords as one alternation; finditer offsets anchor the education
+# entries instead of a keyword loop over every section line
+_DEGREE_RE = re.compile(
+    r'bachelor|master|phd|doctorate|diploma|'
+    r'b\.sc|m\.sc|b\.tech|m\.tech|mba|bba|b\.arch|m\.arch'
+)
+_MAJOR_RE = re.compile(r'(?:in|of)\s+([A-Za-z\s]+?)(?:\s+from|\s+at|,|\n|$)')
+_RELEVANT_EDU_RE = re.compile(r'civil|architecture|mechanical|electrical|engineering')
+
+# "N years ... <tool>" probes, compiled once per dictionary tool rather than
+# per extraction call
+_TOOL_YEARS_RES = {
+    tool: re.compile(rf'(\d+)\+?\s*(?:years?|yrs?).+?{re.escape(tool)}')
+    for tool in TOOLS_MATCHER.terms
+}
+
+_LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+def _iter_lines(text: str):
+    """Yield stripped, non-empty lines without splitting the whole document.
+
+    Header heuristics only read the first few dozen lines, so walking the
+    text lazily avoids materializing a per-document line list."""
+    start = 0
+    n = len(text)
+    find = text.find
+    while start <= n:
+        end = find('\n', start)
+        if end == -1:
+            end = n
+        line = text[start:end].strip()
+        if line:
+            yield line
+        if end == n:
+            break
+        start = end + 1
+
+
+def _lower_ascii(text: str) -> str:
+    """Lowercase via C-level bytes.translate when the text is pure ASCII
+    (the common case for CVs); fall back to Unicode str.lower otherwise."""
+    try:
+        return text.encode('ascii').translate(_LOWER_TABLE).decode('ascii')
+    except UnicodeEncodeError:
+        return text.lower()
+
+# Fast path for the date formats that dominate CVs: "Jan 2020" / "01/2020"
+_SIMPLE_DATE_RE = re.compile(r'^(?:([A-Za-z]{3,9})\s+(\d{4})|(\d{1,2})[-/](\d{4}))$')
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> datetime:
+    """Parse "Jan 2020" / "01/2020" directly; dateutil only as a fallback.
+
+    The same date strings repeat across work entries and across a batch, so
+    results are memoized. Raises like dateutil on unparseable input.
+    """
+    m = _SIMPLE_DATE_RE.match(date_str.strip())
+    if m:
+        if m.group(1):
+            month = _MONTHS.get(m.group(1)[:3].lower())
+            if month:
+                return datetime(int(m.group(2)), month, 1)
+        else:
+            month = int(m.group(3))
+            if 1 <= month <= 12:
+                return datetime(int(m.group(4)), month, 1)
+    return date_parser.parse(date_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_year_month(date_str: str) -> tuple:
+    """Resolve a date string to a (year, month) tuple.
+
+    Duration math only needs year and month, so the hot path skips the
+    datetime object entirely; unparseable input raises like dateutil."""
+    m = _SIMPLE_DATE_RE.match(date_str.strip())
+    if m:
+        if m.group(1):
+            month = _MONTHS.get(m.group(1)[:3].lower())
+            if month:
+                return int(m.group(2)), month
+        else:
+            month = int(m.group(3))
+            if 1 <= month <= 12:
+                return int(m.group(4)), month
+    parsed = date_parser.parse(date_str)
+    return parsed.year, parsed.month
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_phone_lib(ph: str) -> Optional[str]:
+    """phonenumbers parse/validate/format, memoized.
+
+    The library call is the expensive part of phone extraction and the
+    same numbers recur across re-uploads and multi-pass pipelines."""
+    try:
+        parsed = phonenumbers.parse(ph, "US")
+        if phonenumbers.is_valid_number(parsed):
+            return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    except phonenumbers.NumberParseException:
+        return ph
+    return None
+
 
 class EnhancedDataExtractor:
     """Extract comprehensive CV data using advanced regex techniques (NO AI, NO spaCy required)."""
@@ -36,6 +290,16 @@ class EnhancedDataExtractor:
         'Landscape': ['landscape'],
     }
     
+    SUB_DISCIPLINES = {
+        'BIM Modeling': ['bim model', 'revit model'],
+        'BIM Coordination': ['bim coord', 'coordination'],
+        'Technical Office': ['technical office', 'design engineer'],
+        'Site Engineer': ['site engineer', 'site supervision'],
+        'Project Management': ['project manage', 'project manager'],
+    }
+
+    MNC_TEXT_MARKERS = ['multinational', 'international', 'global company', '100+ employees', 'fortune 500']
+
     PROFICIENCY_KEYWORDS = {
         'Expert': ['expert', 'advanced', 'highly proficient', 'mastery', 'specialist'],
         'Intermediate': ['intermediate', 'proficient', 'working knowledge', 'experienced'],
@@ -48,23 +312,45 @@ class EnhancedDataExtractor:
         'Hybrid': ['hybrid', 'mixed'],
         'Flexible': ['flexible']
     }
-    
+
+    SOFT_SKILLS = {
+        'Leadership': ['leadership', 'team lead', 'managed team', 'mentored'],
+        'Communication': ['communication', 'presentation', 'stakeholder', 'client-facing'],
+        'Time Management': ['time management', 'deadline', 'prioritize', 'efficient'],
+        'Coordination': ['coordination', 'collaborate', 'cross-functional', 'liaison'],
+        'Problem Solving': ['problem solving', 'analytical', 'troubleshoot'],
+        'Teamwork': ['teamwork', 'team player', 'collaborative'],
+    }
+
     def __init__(self):
-        self.skills_dict = [s.lower() for s in get_skills_dict()]
-        self.tools_dict = [t.lower() for t in get_tools_dict()]
         self.ats_parser = ATSParser()  # Use ATS parser for project extraction
         print("✅ Enhanced Data Extractor initialized (pure regex - no dependencies)")
-    
+
+    def bulk_extract(self, texts: List[str], n_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Extract a batch of CVs in parallel across cores.
+
+        Convenience method over the module-level extract_batch; per-CV work
+        is pure CPU with no shared mutable state, so it parallelizes cleanly.
+        """
+        return extract_batch(texts, max_workers=n_workers)
+
     def extract_comprehensive_data(self, text: str) -> Dict[str, Any]:
+        # Lowercase once per document and pass the copy down — the helpers
+        # used to redo this O(n) allocation roughly 15 times per CV
+        text_lower = _lower_ascii(text)
+
+        # One pass over the text resolves every keyword-classification category
+        hits = _classify(text_lower)
+
         contact_details = self._extract_contact_details(text)
-        personal_info = self._extract_personal_info(text, email=contact_details.get('email'))
-        position_info = self._extract_position_info(text)
-        work_history = self._extract_work_history(text)
-        gcc_experience = self._calculate_gcc_experience(work_history, text)
-        software_exp = self._extract_software_experience(text)
-        education = self._extract_education_detailed(text)
-        salary_info = self._extract_salary_info(text)
-        evaluation = self._extract_evaluation_criteria(text)
+        personal_info = self._extract_personal_info(text, text_lower, email=contact_details.get('email'))
+        position_info = self._extract_position_info(text, text_lower, hits)
+        work_history = self._extract_work_history(text, text_lower)
+        gcc_experience = self._calculate_gcc_experience(work_history, hits)
+        software_exp = self._extract_software_experience(text_lower)
+        education = self._extract_education_detailed(text, text_lower)
+        salary_info = self._extract_salary_info(text_lower, hits)
+        evaluation = self._extract_evaluation_criteria(text, text_lower, hits)
 
         # AI-enhanced extraction via ATS Parser (includes AI merge)
         ats_data = self.ats_parser.parse(text)
@@ -85,10 +371,12 @@ class EnhancedDataExtractor:
         # Use AI-enhanced education if richer
         ai_education = ats_data.get('education', [])
 
-        # Merge skills: rule-based tools + AI skills
-        rule_skills = set(s.lower() for s in self._extract_skills(text))
-        ai_skills = set(s.lower() for s in (ats_data.get('skills') or []))
-        merged_skills = list(rule_skills | ai_skills)
+        # Merge skills: rule-based tools + AI skills. dict.fromkeys dedupes
+        # while keeping a deterministic order (dictionary hits, then AI extras)
+        merged_skills = list(dict.fromkeys(itertools.chain(
+            SKILLS_MATCHER.scan_ordered(text_lower, lowered=True),
+            (s.lower() for s in (ats_data.get('skills') or [])),
+        )))
 
         return {
             'name': personal_info.get('name'),
@@ -122,7 +410,7 @@ class EnhancedDataExtractor:
             'projects': projects,
 
             'skills': merged_skills,
-            'tools': self._extract_tools(text),
+            'tools': TOOLS_MATCHER.scan_ordered(text_lower, lowered=True),
             'education': [{'degree': e.get('degree', ''), 'year': e.get('graduation_year', '')} for e in education],
             'experience': [{'role': w.get('job_title', ''), 'dates': f"{w.get('start_date', '')} - {w.get('end_date', '')}"}
                            for w in work_history],
@@ -148,62 +436,57 @@ class EnhancedDataExtractor:
     # NEW & IMPROVED NAME EXTRACTION (HIGHEST ACCURACY)
     # ===================================================================
     
-    def _extract_name(self, text: str, email: Optional[str] = None) -> Optional[str]:
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        
-        blacklist = [
-            'resume','curriculum','vitae','cv','profile',
-            'experience','education','skills','projects',
-            'professional summary','contact','work history',
-            'microsoft office', 'microsoft', 'adobe', 'autocad',
-            'confidential', 'page'
-        ]
-        
+    def _extract_name(self, text: str, text_lower: Optional[str] = None, email: Optional[str] = None) -> Optional[str]:
+        # Only the document header matters here — never split the whole text.
+        # Raw and lowered lines come from parallel walks of the two buffers,
+        # so no per-line .lower() allocation is needed.
+        if text_lower is None:
+            text_lower = text.lower()
+        pairs = list(itertools.islice(zip(_iter_lines(text), _iter_lines(text_lower)), 25))
+
         # 1. Try from email (stable)
         if email:
             username = email.split('@')[0]
-            username_clean = re.sub(r'[^a-z]', '', username.lower())
-            
-            for line in lines[:25]:
-                l = line.lower()
-                if any(k in l for k in blacklist):
+            username_clean = _NON_ALPHA_RE.sub('', username.lower())
+
+            for line, l in pairs:
+                # Digit-led lines are addresses/phones, never names
+                if line[:1].isdigit():
+                    continue
+                if _NAME_BLACKLIST_RE.search(l):
                     continue
                 if len(line.split()) <= 6:
-                    l_alpha = re.sub(r'[^a-z]', '', l)
+                    l_alpha = _NON_ALPHA_RE.sub('', l)
                     if len(l_alpha) >= 3:
                         if username_clean in l_alpha or l_alpha in username_clean:
                             if len(line.split()) >= 2:
                                 return line.title()
         
         # 2. Look for typical patterns (new improvement)
-        name_patterns = [
-            r'^(?:name)[:\s]+([A-Za-z][A-Za-z.\-]*(?:\s+[A-Za-z][A-Za-z.\-]*)+)$',
-            r'^([A-Za-z][A-Za-z.\-]*(?:\s+[A-Za-z][A-Za-z.\-]*){1,3})$'
-        ]
-        
-        for line in lines[:20]:
-            l = line.lower()
-            if any(k in l for k in blacklist):
+        for line, l in pairs[:20]:
+            if line[:1].isdigit():
                 continue
-            
-            for pattern in name_patterns:
-                m = re.match(pattern, line.strip(), re.IGNORECASE)
-                if m:
-                    name = m.group(1).strip()
-                    if 2 <= len(name.split()) <= 4:
-                        return name.title()
+            if _NAME_BLACKLIST_RE.search(l):
+                continue
+
+            m = _NAME_LINE_RE.match(line)
+            if m:
+                name = (m.group('labeled') or m.group('bare')).strip()
+                if 2 <= len(name.split()) <= 4:
+                    return name.title()
         
         # 3. Final fallback: first valid-looking name line
-        for line in lines[:15]:
-            l = line.lower()
-            if any(k in l for k in blacklist):
+        for line, l in pairs[:15]:
+            if line[:1].isdigit():
+                continue
+            if _NAME_BLACKLIST_RE.search(l):
                 continue
             words = line.split()
             if 2 <= len(words) <= 4:
                 # Check if it looks like a software list (contains version numbers)
                 if any(c.isdigit() for c in line):
                     continue
-                if all(re.match(r'^[A-Za-z][A-Za-z.\-]*$', w) for w in words):
+                if all(_is_name_word(w) for w in words):
                     return line.title()
         
         return None
@@ -212,36 +495,33 @@ class EnhancedDataExtractor:
     # (Everything below remains EXACTLY as your original file, untouched)
     # ===================================================================
 
-    def _extract_personal_info(self, text: str, email: Optional[str] = None) -> Dict[str, Any]:
+    def _extract_personal_info(self, text: str, text_lower: str, email: Optional[str] = None) -> Dict[str, Any]:
         info = {}
-        info['name'] = self._extract_name(text, email)
-        dob_patterns = [
-            r'(?:date of birth|dob|born)[:\s]+(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-            r'(?:date of birth|dob|born)[:\s]+(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{2,4})'
-        ]
-        for pattern in dob_patterns:
-            match = re.search(pattern, text.lower())
+        info['name'] = self._extract_name(text, text_lower, email)
+        tl = text_lower
+        for pattern in _DOB_PATTERNS:
+            match = pattern.search(tl)
             if match:
                 try:
-                    info['date_of_birth'] = date_parser.parse(match.group(1)).strftime('%Y-%m-%d')
+                    info['date_of_birth'] = _parse_date_cached(match.group(1)).strftime('%Y-%m-%d')
                     break
                 except:
                     pass
-        # Improved nationality regex to stop at newlines or common delimiters
-        nationality_pattern = r'(?:nationality|citizen)[:\s]+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)(?:[\n\r,.]|$)'
-        match = re.search(nationality_pattern, text.lower())
+        # Nationality regex stops at newlines or common delimiters
+        match = _NATIONALITY_RE.search(tl)
         if match:
             info['nationality'] = match.group(1).strip().title()
-        marital_patterns = ['single', 'married', 'divorced', 'widowed']
-        for status in marital_patterns:
-            if re.search(rf'\b{status}\b', text.lower()):
+        marital_hits = set(_MARITAL_RE.findall(tl))
+        for status in _MARITAL_STATUSES:
+            if status in marital_hits:
                 info['marital_status'] = status.title()
                 break
-        military_patterns = ['completed', 'exempted', 'postponed', 'not applicable']
-        for status in military_patterns:
-            if re.search(rf'military[:\s]+{status}', text.lower()):
-                info['military_status'] = status.title()
-                break
+        if 'military' in tl:
+            military_hits = set(_MILITARY_RE.findall(tl))
+            for status in _MILITARY_STATUSES:
+                if status in military_hits:
+                    info['military_status'] = status.title()
+                    break
         location = self._extract_location(text)
         if location:
             parts = location.split(',')
@@ -253,10 +533,15 @@ class EnhancedDataExtractor:
         return info
     
     def _extract_contact_details(self, text: str) -> Dict[str, Any]:
-        details = {}
-        details['email'] = self._extract_email(text)
+        details = {'email': None}
+        all_urls = []
+        for m in _CONTACT_RE.finditer(text):
+            if m.lastgroup == 'email':
+                if details['email'] is None:
+                    details['email'] = m.group('email')
+            else:
+                all_urls.append(m.group('url'))
         details['phone'] = self._extract_phone(text)
-        all_urls = self._extract_urls(text)
         details['all_urls'] = all_urls
         for url in all_urls:
             u = url.lower()
@@ -270,20 +555,15 @@ class EnhancedDataExtractor:
         details['location'] = self._extract_location(text)
         return details
     
-    def _extract_position_info(self, text: str) -> Dict[str, Any]:
+    def _extract_position_info(self, text: str, text_lower: str, hits: Dict[str, set]) -> Dict[str, Any]:
         info = {}
-        patterns = [
-            r'(?:current|present)[^\n]*?(?:position|role|title)[:\s]+([^\n]+)',
-            r'(?:position|role|title)[:\s]+([^\n]+)',
-        ]
-        for p in patterns:
-            m = re.search(p, text.lower())
+        for p in _POSITION_PATTERNS:
+            m = p.search(text_lower)
             if m:
                 info['current_position'] = m.group(1).strip().title()
                 break
         if not info.get('current_position'):
-            lines = text.split('\n')
-            for line in lines[:30]:
+            for line in itertools.islice(_iter_lines(text), 30):
                 for kw in ['architect', 'engineer', 'manager', 'designer', 'coordinator', 'specialist']:
                     if kw in line.lower() and len(line.split()) <= 6:
                         cleaned = self._clean_header_line(line)
@@ -292,53 +572,71 @@ class EnhancedDataExtractor:
                             break
                 if info.get('current_position'):
                     break
-        for d, kws in self.DISCIPLINES.items():
-            if any(kw in text.lower() for kw in kws):
+        # Classification hits come from the single scan; dict order keeps the
+        # original first-match priority
+        disc_hits = hits.get('discipline', ())
+        for d in self.DISCIPLINES:
+            if d in disc_hits:
                 info['discipline'] = d
                 break
-        subdisc = {
-            'BIM Modeling': ['bim model', 'revit model'],
-            'BIM Coordination': ['bim coord', 'coordination'],
-            'Technical Office': ['technical office', 'design engineer'],
-            'Site Engineer': ['site engineer', 'site supervision'],
-            'Project Management': ['project manage', 'project manager'],
-        }
-        for sd, kws in subdisc.items():
-            if any(kw in text.lower() for kw in kws):
+        sub_hits = hits.get('sub_discipline', ())
+        for sd in self.SUB_DISCIPLINES:
+            if sd in sub_hits:
                 info['sub_discipline'] = sd
                 break
         return info
     
-    def _extract_work_history(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_work_history(self, text: str, text_lower: str) -> List[Dict[str, Any]]:
         work_history = []
-        section = self._extract_experience_section(text)
+        start, end = self._section_bounds(text_lower, _EXP_START_MARKERS, _EXP_END_MARKERS)
+        if start == -1:
+            return []
+        section = text[start:end]
         if not section:
             return []
-        date_pattern = r'(\d{1,2}[-/]\d{4}|\w+\s+\d{4})\s*[-–—to]+\s*(\d{1,2}[-/]\d{4}|\w+\s+\d{4}|present|current)'
+        # One finditer over the section locates the handful of date anchors
+        # directly, instead of lowercasing and regex-probing every line.
+        # Each entry starts at the beginning of the line holding its date;
+        # the date groups are kept so the entry parser never re-scans them.
+        anchor_starts = []
+        anchor_dates = []
+        for m in _DATE_RANGE_RE.finditer(text_lower[start:end]):
+            line_start = section.rfind('\n', 0, m.start()) + 1
+            if not anchor_starts or line_start != anchor_starts[-1]:
+                anchor_starts.append(line_start)
+                anchor_dates.append((m.group(1), m.group(2)))
+        if not anchor_starts:
+            # No recognizable date anchors (e.g. year-only ranges) — fall back
+            # to parsing the whole section as a single entry, which still
+            # recovers company, responsibilities, and the MNC/GCC flags
+            job = self._parse_work_entry(section)
+            return [job] if job else []
         entries = []
-        current = []
-        for line in section.split('\n'):
-            if re.search(date_pattern, line.lower()):
-                if current:
-                    entries.append('\n'.join(current))
-                current = [line]
-            else:
-                current.append(line)
-        if current:
-            entries.append('\n'.join(current))
-        for e in entries:
-            job = self._parse_work_entry(e)
+        lead = section[:anchor_starts[0]]
+        if lead.strip():
+            entries.append((lead, None))
+        for i, entry_start in enumerate(anchor_starts):
+            entry_end = anchor_starts[i + 1] if i + 1 < len(anchor_starts) else len(section)
+            entries.append((section[entry_start:entry_end], anchor_dates[i]))
+        for e, dates in entries:
+            job = self._parse_work_entry(e, dates)
             if job:
                 work_history.append(job)
         return work_history
     
-    def _parse_work_entry(self, entry: str) -> Optional[Dict[str, Any]]:
+    def _parse_work_entry(self, entry: str, dates: Optional[tuple] = None) -> Optional[Dict[str, Any]]:
         job = {}
-        date_pattern = r'(\w+\s+\d{4}|\d{1,2}[-/]\d{4})\s*[-–—to]+\s*(\w+\s+\d{4}|\d{1,2}[-/]\d{4}|present|current)'
-        dm = re.search(date_pattern, entry.lower())
-        if dm:
-            job['start_date'] = dm.group(1).strip().title()
-            job['end_date'] = dm.group(2).strip().title()
+        # Entries are parsed a few different ways below — lowercase once
+        entry_lower = entry.lower()
+        # The section splitter already matched the entry's date range;
+        # only standalone callers pay for a fresh search
+        if dates is None:
+            dm = _ENTRY_DATE_RE.search(entry_lower)
+            if dm:
+                dates = (dm.group(1), dm.group(2))
+        if dates:
+            job['start_date'] = dates[0].strip().title()
+            job['end_date'] = dates[1].strip().title()
             job['duration_months'] = self._calculate_duration(job['start_date'], job['end_date'])
         
         lines = [l.strip() for l in entry.split('\n') if l.strip()]
@@ -347,75 +645,71 @@ class EnhancedDataExtractor:
             job['job_title'] = self._clean_header_line(lines[0])
             
         job['seniority_level'] = self._determine_seniority(job.get('job_title', ''))
-        cm = re.search(r'(?:at|@)\s+([^,\n]+?)(?:,|\n|$)', entry)
-        if cm:
-            job['company_name'] = cm.group(1).strip()
-        else:
-            if len(lines) > 1:
-                # If 2nd line looks like a company (not a bullet point)
-                if not re.match(r'^[-•●]', lines[1]):
-                   job['company_name'] = lines[1]
-                   
-        locm = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', entry)
-        if locm:
-            job['company_location'] = f"{locm.group(1)}, {locm.group(2)}"
-        job['mode_of_work'] = self._determine_work_mode(entry)
+        # Single pass over the entry; dispatch on which named group matched
+        company = None
+        location = None
         resp = []
-        for l in lines:
-            if re.match(r'^[-•●]\s', l) or l.lower().startswith(('responsible', 'managed', 'led', 'developed')):
-                resp.append(l.strip())
-        job['roles_responsibilities'] = '; '.join(resp) if resp else ''
         projects = []
-        pp = r'(?:project|development|building|complex)[:s]?\s+([A-Z][^\n,.]+?)(?:[,.\n]|$)'
-        for m in re.finditer(pp, entry):
-            projects.append(m.group(1).strip())
+        for m in _ENTRY_SCAN_RE.finditer(entry):
+            if m.group('resp') is not None:
+                resp.append(m.group('resp').strip())
+            elif m.group('company') is not None:
+                if company is None:
+                    company = m.group('company_name').strip()
+            elif m.group('loc') is not None:
+                if location is None:
+                    location = f"{m.group('loc_city')}, {m.group('loc_country')}"
+            else:
+                projects.append(m.group('project_name').strip())
+        if company:
+            job['company_name'] = company
+        elif len(lines) > 1 and not _BULLET_PREFIX_RE.match(lines[1]):
+            # If 2nd line looks like a company (not a bullet point)
+            job['company_name'] = lines[1]
+        if location:
+            job['company_location'] = location
+        job['mode_of_work'] = self._determine_work_mode(entry_lower)
+        job['roles_responsibilities'] = '; '.join(resp) if resp else ''
         job['key_projects'] = projects[:5]
-        gcc = any(g in entry.lower() for g in self.GCC_COUNTRIES + self.GCC_CITIES)
+        gcc = _GCC_RE.search(entry_lower) is not None
         job['project_locations'] = ['GCC'] if gcc else ['Local']
         return job if job.get('job_title') else None
     
     def _clean_header_line(self, line: str) -> str:
         """Removes dates, bullets, and common noise from header lines."""
-        # 1. Remove date ranges (start or end of line)
-        # matches: Jul 2024 - Present, 2019-2024, etc.
-        date_pattern = r'(?:\w+\s+\d{4}|\d{1,2}[-/]\d{4}|\d{4})\s*[-–—to]+\s*(?:\w+\s+\d{4}|\d{1,2}[-/]\d{4}|present|current|\d{4})'
-        line = re.sub(date_pattern, '', line, flags=re.IGNORECASE)
-        
-        # 2. Remove leading bullets/arrows
-        line = re.sub(r'^[\->•●:;|\s]+', '', line)
-        
-        # 3. Remove "at Company" suffix if it exists (heuristic)
-        line = re.sub(r'\s+(?:at|@)\s+.*$', '', line, flags=re.IGNORECASE)
-        
-        return line.strip()
+        # Date ranges and the "at Company" suffix (heuristic) in one pass,
+        # then leading bullets/arrows against the cleaned start of line
+        line = _HEADER_STRIP_RE.sub('', line)
+        return _HEADER_BULLET_RE.sub('', line).strip()
 
     def _calculate_duration(self, start_date: str, end_date: str) -> int:
         try:
-            if 'present' in end_date.lower() or 'current' in end_date.lower():
-                end = datetime.now()
+            if end_date.lower().strip() in _PRESENT_TOKENS:
+                now = datetime.now()
+                end_y, end_m = now.year, now.month
             else:
-                end = date_parser.parse(end_date)
-            start = date_parser.parse(start_date)
-            months = (end.year - start.year) * 12 + (end.month - start.month)
+                end_y, end_m = _parse_year_month(end_date)
+            start_y, start_m = _parse_year_month(start_date)
+            months = (end_y - start_y) * 12 + (end_m - start_m)
             return max(months, 0)
-        except:
+        except (ValueError, OverflowError):
             return 0
     
     def _determine_seniority(self, job_title: str) -> str:
-        t = job_title.lower()
-        for level, kws in self.SENIORITY_LEVELS.items():
-            if any(kw in t for kw in kws):
+        found = {_SENIORITY_KW[kw] for kw in _SENIORITY_RE.findall(job_title.lower())}
+        for level in self.SENIORITY_LEVELS:
+            if level in found:
                 return level
         return 'Mid-Level'
-    
-    def _determine_work_mode(self, text: str) -> str:
-        tl = text.lower()
-        for mode, kws in self.WORK_MODES.items():
-            if any(kw in tl for kw in kws):
+
+    def _determine_work_mode(self, text_lower: str) -> str:
+        found = {_WORK_MODE_KW[kw] for kw in _WORK_MODE_RE.findall(text_lower)}
+        for mode in self.WORK_MODES:
+            if mode in found:
                 return mode
         return 'On-site'
     
-    def _calculate_gcc_experience(self, work_history: List[Dict], text: str) -> Dict[str, Any]:
+    def _calculate_gcc_experience(self, work_history: List[Dict], hits: Dict[str, set]) -> Dict[str, Any]:
         total = 0
         gcc = 0
         for job in work_history:
@@ -423,13 +717,12 @@ class EnhancedDataExtractor:
             total += d
             if 'GCC' in job.get('project_locations', []):
                 gcc += d
-        worked_with_mncs = any(k in text.lower() for k in ['multinational', 'international', 'global company', '100+ employees', 'fortune 500'])
-        mnc_list = ['aecom', 'jacobs', 'kpf', 'gensler', 'hok', 'atkins', 'parsons', 'arcadis']
-        for job in work_history:
-            c = job.get('company_name','').lower()
-            if any(m in c for m in mnc_list):
-                worked_with_mncs = True
-                break
+        worked_with_mncs = bool(hits.get('mnc_marker'))
+        if not worked_with_mncs:
+            for job in work_history:
+                if _MNC_RE.search(job.get('company_name', '').lower()):
+                    worked_with_mncs = True
+                    break
         return {
             'total_experience_years': round(total/12,1),
             'relevant_experience_years': round(total/12,1),
@@ -438,23 +731,26 @@ class EnhancedDataExtractor:
             'worked_with_mncs': worked_with_mncs
         }
     
-    def _extract_software_experience(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_software_experience(self, text_lower: str) -> List[Dict[str, Any]]:
         out = []
-        tl = text.lower()
-        found = []
-        for tool in self.tools_dict:
-            if re.search(r'\b'+re.escape(tool)+r'\b', tl):
-                found.append(tool)
-        for tool in found:
+        tl = text_lower
+        # One linear pass over the text finds every tool hit, instead of one
+        # full-text scan per dictionary term. The hit offsets double as
+        # context windows, so no second per-tool regex over the whole text.
+        contexts: Dict[str, List[str]] = {}
+        for start, end, tool in TOOLS_MATCHER.iter_spans(tl):
+            contexts.setdefault(tool, []).append(tl[max(0, start - 100):end + 100])
+        for tool, windows in contexts.items():
             sw = {'software_name': tool.title()}
-            ctx = ' '.join(re.findall(rf'(.{{0,100}}\b{re.escape(tool)}\b.{{0,100}})', tl))
+            ctx = ' '.join(windows)
+            found = {_PROF_KW[kw] for kw in _PROF_RE.findall(ctx)}
             prof = 'Intermediate'
-            for level, kws in self.PROFICIENCY_KEYWORDS.items():
-                if any(kw in ctx for kw in kws):
+            for level in self.PROFICIENCY_KEYWORDS:
+                if level in found:
                     prof = level
                     break
             sw['proficiency_level'] = prof
-            ym = re.search(rf'(\d+)\+?\s*(?:years?|yrs?).+?{re.escape(tool)}', ctx)
+            ym = _TOOL_YEARS_RES[tool].search(ctx)
             if ym:
                 sw['years_of_experience'] = float(ym.group(1))
             else:
@@ -463,88 +759,90 @@ class EnhancedDataExtractor:
             out.append(sw)
         return out
     
-    def _extract_education_detailed(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_education_detailed(self, text: str, text_lower: Optional[str] = None) -> List[Dict[str, Any]]:
         out = []
-        section = self._extract_education_section(text)
+        if text_lower is None:
+            text_lower = text.lower()
+        start, end = self._section_bounds(text_lower, _EDU_START_MARKERS, _EDU_END_MARKERS)
+        if start == -1:
+            return []
+        section = text[start:end]
         if not section:
             return []
-        degree_keywords = [
-            'bachelor','master','phd','doctorate','diploma',
-            'b.sc','m.sc','b.tech','m.tech','mba','bba','b.arch','m.arch'
-        ]
-        lines = section.split('\n')
+        # Degree hits anchor the entries; line boundaries are recovered from
+        # the match offsets so only hit lines are sliced, not every line.
+        # The lowered section is a slice of the shared lowered copy — no
+        # per-call .lower() of the section.
+        sec_lower = text_lower[start:end]
         current = {}
-        for i, line in enumerate(lines):
-            ll = line.lower()
-            for k in degree_keywords:
-                if k in ll:
-                    if current:
-                        out.append(current)
-                    
-                    # Clean the degree line (remove dates)
-                    cleaned_degree = self._clean_header_line(line)
-                    current = {'degree': cleaned_degree}
-                    
-                    mm = re.search(r'(?:in|of)\s+([A-Za-z\s]+?)(?:\s+from|\s+at|,|\n|$)', line)
-                    if mm:
-                        current['major'] = mm.group(1).strip()
-                    if i+1 < len(lines):
-                        current['university'] = lines[i+1].strip()
-                    
-                    # Find years (extract the LAST year found, which is typically graduation)
-                    years = re.findall(r'\b(19|20)\d{2}\b', line)
-                    if not years and i+1 < len(lines):
-                        years = re.findall(r'\b(19|20)\d{2}\b', lines[i+1])
-                    
-                    if years:
-                        current['graduation_year'] = years[-1]
-                        
-                    rel = ['civil','architecture','mechanical','electrical','engineering']
-                    current['relevant_qualification'] = any(r in ll for r in rel)
-                    break
+        line_end = -1
+        for m in _DEGREE_RE.finditer(sec_lower):
+            if m.start() <= line_end:
+                continue  # same line as the previous degree hit
+            line_start = section.rfind('\n', 0, m.start()) + 1
+            line_end = section.find('\n', m.start())
+            if line_end == -1:
+                line_end = len(section)
+            line = section[line_start:line_end]
+            ll = sec_lower[line_start:line_end]
+
+            if current:
+                out.append(current)
+
+            # Clean the degree line (remove dates)
+            current = {'degree': self._clean_header_line(line)}
+
+            mm = _MAJOR_RE.search(line)
+            if mm:
+                current['major'] = mm.group(1).strip()
+
+            next_line = None
+            if line_end < len(section):
+                next_end = section.find('\n', line_end + 1)
+                if next_end == -1:
+                    next_end = len(section)
+                next_line = section[line_end + 1:next_end]
+                current['university'] = next_line.strip()
+
+            # Find years (extract the LAST year found, which is typically graduation)
+            years = _YEAR_RE.findall(line)
+            if not years and next_line is not None:
+                years = _YEAR_RE.findall(next_line)
+
+            if years:
+                current['graduation_year'] = years[-1]
+
+            current['relevant_qualification'] = _RELEVANT_EDU_RE.search(ll) is not None
         if current:
             out.append(current)
         certs = []
-        cp = r'(?:certified|certification|certificate)[:s]?\s+([A-Z][^\n,.]+?)(?:[,.\n]|$)'
-        for m in re.finditer(cp, text):
+        for m in _CERT_RE.finditer(text):
             certs.append(m.group(1).strip())
         for e in out:
             e['certifications'] = certs
         return out
     
-    def _extract_salary_info(self, text: str) -> Dict[str, Any]:
+    def _extract_salary_info(self, text_lower: str, hits: Dict[str, set]) -> Dict[str, Any]:
         out = {}
-        tl = text.lower()
-        cur = [
-            r'current\s+salary[:\s]+(?:aed\s+)?(\d+[,\d]*)',
-            r'salary[:\s]+(?:aed\s+)?(\d+[,\d]*)',
-        ]
-        for p in cur:
-            m = re.search(p, tl)
+        tl = text_lower
+        for p in _CUR_SALARY_PATTERNS:
+            m = p.search(tl)
             if m:
                 try:
                     out['current_salary_aed'] = float(m.group(1).replace(',', ''))
                     break
                 except:
                     pass
-        expc = [
-            r'expected\s+salary[:\s]+(?:aed\s+)?(\d+[,\d]*)',
-            r'salary\s+expectation[:\s]+(?:aed\s+)?(\d+[,\d]*)',
-        ]
-        for p in expc:
-            m = re.search(p, tl)
+        for p in _EXP_SALARY_PATTERNS:
+            m = p.search(tl)
             if m:
                 try:
                     out['expected_salary_aed'] = float(m.group(1).replace(',', ''))
                     break
                 except:
                     pass
-        notice = [
-            r'notice\s+period[:\s]+(\d+)\s*(?:days?|weeks?|months?)',
-            r'availability[:\s]+(\d+)\s*(?:days?|weeks?|months?)',
-        ]
-        for p in notice:
-            m = re.search(p, tl)
+        for p in _NOTICE_PATTERNS:
+            m = p.search(tl)
             if m:
                 d = int(m.group(1))
                 if 'week' in m.group(0):
@@ -553,125 +851,262 @@ class EnhancedDataExtractor:
                     d *= 30
                 out['notice_period_days'] = d
                 break
-        reloc = ['willing to relocate','open to relocation','ready to relocate']
-        out['willing_to_relocate'] = any(r in tl for r in reloc)
-        travel = ['willing to travel','open to travel','ready to travel']
-        out['willing_to_travel'] = any(r in tl for r in travel)
+        mobility = hits.get('mobility', ())
+        out['willing_to_relocate'] = 'relocate' in mobility
+        out['willing_to_travel'] = 'travel' in mobility
         return out
     
-    def _extract_evaluation_criteria(self, text: str) -> Dict[str, Any]:
+    def _extract_evaluation_criteria(self, text: str, text_lower: str, hits: Dict[str, set]) -> Dict[str, Any]:
         out = {}
-        tl = text.lower()
+        tl = text_lower
         score = 0
-        if 'portfolio' in tl or 'behance' in tl:
+        if 'portfolio_marker' in hits:
             score += 30
-        score += min(len(re.findall(r'\bproject\b', tl))*5, 40)
+        # The score caps at 8 mentions — stop counting there instead of
+        # materializing every match in a long document
+        n = 0
+        for _ in _PROJECT_WORD_RE.finditer(tl):
+            n += 1
+            if n >= 8:
+                break
+        score += n * 5
         if len(text) > 2000:
             score += 30
         elif len(text) > 1000:
             score += 20
         out['portfolio_relevancy_score'] = min(score, 100)
         wc = len(text.split())
-        if any(k in tl for k in ['excellent','proficient','fluent','native']):
+        if 'fluency_marker' in hits:
             out['english_proficiency'] = 'Fluent'
         elif wc > 500 and len(text) > 2000:
             out['english_proficiency'] = 'Good'
         else:
             out['english_proficiency'] = 'Basic'
-        soft = {
-            'Leadership': ['leadership','team lead','managed team','mentored'],
-            'Communication': ['communication','presentation','stakeholder','client-facing'],
-            'Time Management': ['time management','deadline','prioritize','efficient'],
-            'Coordination': ['coordination','collaborate','cross-functional','liaison'],
-            'Problem Solving': ['problem solving','analytical','troubleshoot'],
-            'Teamwork': ['teamwork','team player','collaborative'],
-        }
-        found = []
-        for s, kws in soft.items():
-            if any(k in tl for k in kws):
-                found.append(s)
-        out['soft_skills'] = found
+        # Soft-skill keywords ride the shared classification scan
+        soft_hits = hits.get('soft_skill', ())
+        out['soft_skills'] = [s for s in self.SOFT_SKILLS if s in soft_hits]
         return out
     
     # === HELPERS BELOW ===
     
     def _extract_email(self, text: str) -> Optional[str]:
-        m = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        return m[0] if m else None
+        # '@' is mandatory in any match — a C-level containment check skips
+        # the regex entirely on OCR output with no email
+        if '@' not in text:
+            return None
+        m = _EMAIL_RE.search(text)
+        return m.group(0) if m else None
     
     def _extract_phone(self, text: str) -> Optional[str]:
-        phones = re.findall(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-        if phones:
-            ph = ''.join(phones[0].split())
-            try:
-                parsed = phonenumbers.parse(ph, "US")
-                if phonenumbers.is_valid_number(parsed):
-                    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-            except:
+        m = _PHONE_RE.search(text)
+        if m:
+            ph = ''.join(m.group(0).split())
+            # Clean NANP numbers skip the metadata-heavy phonenumbers parse;
+            # only ambiguous lengths pay for the library call
+            digits = ''.join(c for c in ph if c.isdigit())
+            if len(digits) == 10:
+                return f'+1{digits}'
+            if len(digits) == 11 and digits.startswith('1'):
+                return f'+{digits}'
+            if _E164_RE.match(ph):
                 return ph
+            return _parse_phone_lib(ph)
         return None
     
     def _extract_location(self, text: str) -> Optional[str]:
-        m = re.findall(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+)\b', text)
+        # Only the first match is used — search stops there, findall didn't
+        m = _LOC_RE.search(text)
         if m:
-            c, s = m[0]
-            return f"{c}, {s}"
+            return f"{m.group(1)}, {m.group(2)}"
         return None
     
     def _extract_skills(self, text: str) -> List[str]:
-        tl = text.lower()
-        out = []
-        for s in self.skills_dict:
-            if re.search(r'\b'+re.escape(s)+r'\b', tl):
-                out.append(s)
-        return list(set(out))
-    
+        return SKILLS_MATCHER.scan_ordered(text)
+
     def _extract_tools(self, text: str) -> List[str]:
-        tl = text.lower()
-        out = []
-        for t in self.tools_dict:
-            if re.search(r'\b'+re.escape(t)+r'\b', tl):
-                out.append(t)
-        return list(set(out))
+        return TOOLS_MATCHER.scan_ordered(text)
     
     def _extract_urls(self, text: str) -> List[str]:
-        return re.findall(r'https?://[^\s<>"{}|\\^`\[\]]+', text)
-    
-    def _extract_experience_section(self, text: str) -> str:
-        exp_markers = [r'(?:work\s+)?experience', r'employment\s+history', r'professional\s+experience', r'career\s+history']
-        edu_markers = [r'education', r'academic', r'qualifications']
-        tl = text.lower()
-        start = -1
-        for m in exp_markers:
-            mm = re.search(m, tl)
-            if mm:
-                start = mm.end()
-                break
-        if start==-1:
-            return ''
-        end = len(text)
-        for m in edu_markers + [r'skills', r'certifications']:
-            mm = re.search(m, tl[start:])
-            if mm:
-                end = start + mm.start()
-                break
-        return text[start:end]
+        # 'http' containment is a cheap reject for link-free documents
+        if 'http' not in text:
+            return []
+        return [m.group(0) for m in _URL_RE.finditer(text)]
     
-    def _extract_education_section(self, text: str) -> str:
-        markers = [r'education', r'academic', r'qualifications', r'degrees']
-        tl = text.lower()
+    def _extract_experience_section(self, text: str, text_lower: Optional[str] = None) -> str:
+        start, end = self._section_bounds(
+            text_lower if text_lower is not None else text.lower(),
+            _EXP_START_MARKERS, _EXP_END_MARKERS)
+        return text[start:end] if start != -1 else ''
+
+    def _extract_education_section(self, text: str, text_lower: Optional[str] = None) -> str:
+        start, end = self._section_bounds(
+            text_lower if text_lower is not None else text.lower(),
+            _EDU_START_MARKERS, _EDU_END_MARKERS)
+        return text[start:end] if start != -1 else ''
+
+    def _section_bounds(self, text_lower: str, start_markers: tuple, end_markers: tuple) -> Tuple[int, int]:
+        pos = _scan_sections(text_lower)
         start = -1
-        for m in markers:
-            mm = re.search(m, tl)
-            if mm:
-                start = mm.end()
-                break
-        if start==-1:
-            return ''
-        end = len(text)
-        for m in [r'certifications?', r'skills', r'languages', r'references']:
-            mm = re.search(m, tl[start:])
-            if mm:
-                end = start + mm.start()
+        for m in start_markers:
+            if m in pos:
+                start = pos[m][0] + len(m)
                 break
-        return text[start:end]
+        if start == -1:
+            return -1, -1
+        end = len(text_lower)
+        for m in end_markers:
+            if m in pos:
+                i = _first_marker_at_or_after(pos[m], start)
+                if i != -1:
+                    end = i
+                    break
+        return start, end
+
+
+# ---------------------------------------------------------------------------
+# One-pass keyword classification.
+# Every category that used to be resolved with its own `any(kw in text ...)`
+# scan is tagged into one table; a single findall over the lowered text then
+# answers all of them. Plain substring semantics (no word boundaries) match
+# the original checks.
+# ---------------------------------------------------------------------------
+# keyword -> ((category, value), ...): one keyword can serve several
+# categories ('coordination' is both a sub-discipline and a soft skill)
+_CLASS_KW: Dict[str, tuple] = {}
+
+
+def _register_class_keywords(category: str, mapping: Dict[Any, List[str]]):
+    for value, keywords in mapping.items():
+        for kw in keywords:
+            kw = kw.lower()
+            pairs = _CLASS_KW.get(kw, ())
+            if (category, value) not in pairs:
+                _CLASS_KW[kw] = pairs + ((category, value),)
+
+
+_register_class_keywords('discipline', EnhancedDataExtractor.DISCIPLINES)
+_register_class_keywords('sub_discipline', EnhancedDataExtractor.SUB_DISCIPLINES)
+_register_class_keywords('mnc_marker', {True: EnhancedDataExtractor.MNC_TEXT_MARKERS})
+_register_class_keywords('soft_skill', EnhancedDataExtractor.SOFT_SKILLS)
+_register_class_keywords('mobility', {
+    'relocate': ['willing to relocate', 'open to relocation', 'ready to relocate'],
+    'travel': ['willing to travel', 'open to travel', 'ready to travel'],
+})
+_register_class_keywords('portfolio_marker', {True: ['portfolio', 'behance']})
+_register_class_keywords('fluency_marker', {True: ['excellent', 'proficient', 'fluent', 'native']})
+
+# Zero-width lookahead so keywords contained inside a longer phrase still
+# match ('coordination' inside 'bim coordination'); longest alternatives
+# first so the capture reports the longest phrase at each position
+_CLASS_RE = re.compile(
+    '(?=(' + '|'.join(sorted(map(re.escape, _CLASS_KW), key=len, reverse=True)) + '))'
+)
+
+# A captured phrase also stands in for every registered keyword it begins
+# with — 'bim coord' must still count as a 'bim' hit even though both start
+# at the same position and only the longer one is reported
+_CLASS_TARGETS: Dict[str, tuple] = {
+    kw: tuple(dict.fromkeys(
+        pair
+        for other in _CLASS_KW if kw.startswith(other)
+        for pair in _CLASS_KW[other]
+    ))
+    for kw in _CLASS_KW
+}
+
+
+def _classify(text_lower: str) -> Dict[str, set]:
+    """Resolve all keyword-classification categories in one scan."""
+    hits: Dict[str, set] = {}
+    for kw in set(_CLASS_RE.findall(text_lower)):
+        for category, value in _CLASS_TARGETS[kw]:
+            hits.setdefault(category, set()).add(value)
+    return hits
+
+
+# ---------------------------------------------------------------------------
+# Seniority and work mode: one findall collects every keyword hit, then the
+# first table entry (tables are priority-ordered) with a hit wins — same
+# answer as the old nested any() loops in one pass over the string.
+# ---------------------------------------------------------------------------
+_SENIORITY_KW = {
+    kw: level
+    for level, kws in EnhancedDataExtractor.SENIORITY_LEVELS.items()
+    for kw in kws
+}
+_SENIORITY_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _SENIORITY_KW), key=len, reverse=True))
+)
+_WORK_MODE_KW = {
+    kw: mode
+    for mode, kws in EnhancedDataExtractor.WORK_MODES.items()
+    for kw in kws
+}
+_WORK_MODE_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _WORK_MODE_KW), key=len, reverse=True))
+)
+# GCC markers and MNC company names as single alternations — one C-level
+# scan replaces a Python loop of substring probes (and, for GCC, a fresh
+# list concatenation) per work entry. Plain substring semantics as before.
+_GCC_RE = re.compile('|'.join(sorted(map(
+    re.escape,
+    EnhancedDataExtractor.GCC_COUNTRIES + EnhancedDataExtractor.GCC_CITIES,
+), key=len, reverse=True)))
+_MNC_RE = re.compile(
+    r'aecom|jacobs|kpf|gensler|hok|atkins|parsons|arcadis'
+)
+_PROF_KW = {
+    kw: level
+    for level, kws in EnhancedDataExtractor.PROFICIENCY_KEYWORDS.items()
+    for kw in kws
+}
+_PROF_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _PROF_KW), key=len, reverse=True))
+)
+
+
+# ---------------------------------------------------------------------------
+# BATCH ENTRY POINTS
+# Each CV is independent, so batches parallelize across cores. Workers reuse
+# one extractor per process; on Linux the fork start method shares the
+# compiled patterns and dictionaries copy-on-write instead of rebuilding them.
+# ---------------------------------------------------------------------------
+_EXTRACTOR: Optional[EnhancedDataExtractor] = None
+
+# Pipelines touch the same CV more than once (scoring, then display) and
+# batches contain re-uploads; memoizing per text makes repeat passes free.
+# Results are deep-copied out so cached entries can't be mutated, and huge
+# texts are never held in the cache.
+_MAX_CACHEABLE_CHARS = 200_000
+
+
+@functools.lru_cache(maxsize=128)
+def _extract_cached(text: str) -> Dict[str, Any]:
+    return _EXTRACTOR.extract_comprehensive_data(text)
+
+
+def extract_one(text: str) -> Dict[str, Any]:
+    """Extract one CV via a lazily created per-process singleton extractor."""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = EnhancedDataExtractor()
+    if len(text) < _MAX_CACHEABLE_CHARS:
+        return copy.deepcopy(_extract_cached(text))
+    return _EXTRACTOR.extract_comprehensive_data(text)
+
+
+def extract_batch(texts: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Extract a batch of CVs in parallel with a process pool.
+
+    Results come back in input order. Tiny batches skip the pool — process
+    startup would cost more than the extraction itself.
+    """
+    texts = list(texts)
+    if len(texts) <= 1:
+        return [extract_one(t) for t in texts]
+    # ~4 chunks per worker amortizes IPC on big batches while leaving enough
+    # chunks for the pool to balance uneven CV sizes
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(extract_one, texts, chunksize=chunksize))
@@ -2,6 +2,8 @@
 File validation service for uploaded CVs and portfolios.
 Validates file types, sizes, and performs basic security checks.
 """
+import threading
+
 from fastapi import UploadFile
 from typing import Dict
 from pathlib import Path
@@ -14,20 +16,55 @@ except (ImportError, OSError):
     MAGIC_AVAILABLE = False
     print("⚠️  python-magic not available. MIME type validation will be skipped.")
 
+if MAGIC_AVAILABLE:
+    try:
+        # One long-lived cookie shares the loaded magic database across all
+        # requests; the instance isn't reentrant, so a lock guards it
+        _MAGIC = magic.Magic(mime=True)
+        _MAGIC_LOCK = threading.Lock()
+    except Exception as e:
+        MAGIC_AVAILABLE = False
+        print(f"⚠️  libmagic initialization failed: {e}. MIME type validation will be skipped.")
+
 from app.config import settings
 
+# Streaming read size — keeps per-upload memory at O(chunk), not O(file)
+_CHUNK_SIZE = 64 * 1024
+
+# Basic malware check - check for suspicious patterns
+# In production, integrate with ClamAV or similar
+_SUSPICIOUS_SIGNATURES = (
+    b'<script',
+    b'javascript:',
+    b'eval(',
+)
+# Carry this many bytes between chunks so a signature split across a
+# chunk boundary is still seen
+_SIG_OVERLAP = max(len(s) for s in _SUSPICIOUS_SIGNATURES) - 1
+
+# Leading magic bytes that settle the MIME question on their own — when the
+# header matches, libmagic is skipped entirely. doc/docx stay with libmagic
+# since their OLE/zip containers need deeper inspection.
+_FAST_SIG = {
+    'pdf': (b'%PDF-',),
+    'png': (b'\x89PNG\r\n\x1a\n',),
+    'jpg': (b'\xff\xd8\xff',),
+    'jpeg': (b'\xff\xd8\xff',),
+    'tiff': (b'II*\x00', b'MM\x00*'),
+}
+
 
 class FileValidator:
     """Validates uploaded files for security and compatibility."""
-    
+
     def __init__(self):
         self.allowed_extensions = settings.allowed_extensions_list
         self.max_size_bytes = settings.MAX_FILE_SIZE_MB * 1024 * 1024
-    
+
     async def validate_file(self, file: UploadFile) -> Dict[str, any]:
         """
         Validate an uploaded file.
-        
+
         Returns:
             Dict with 'valid' (bool) and 'error' (str) if invalid
         """
@@ -38,31 +75,59 @@ class FileValidator:
                 "valid": False,
                 "error": f"File extension '.{file_ext}' not allowed. Allowed: {', '.join(self.allowed_extensions)}"
             }
-        
-        # Read file for validation (will reset after)
-        content = await file.read()
-        await file.seek(0)  # Reset file pointer
-        
+
+        # One streaming pass does the size accounting, captures the header
+        # for the MIME sniff, and scans for suspicious signatures — the
+        # upload is never materialized in memory, and an oversize file
+        # aborts without reading its tail.
+        file_size = 0
+        header = b''
+        tail = b''
+        oversize = False
+        suspicious = False
+        while True:
+            chunk = await file.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            file_size += len(chunk)
+            if file_size > self.max_size_bytes:
+                oversize = True
+                break
+            if len(header) < 4096:
+                header += chunk[:4096 - len(header)]
+            if not suspicious:
+                window = (tail + chunk).lower()
+                suspicious = any(sig in window for sig in _SUSPICIOUS_SIGNATURES)
+                tail = chunk[-_SIG_OVERLAP:]
+        await file.seek(0)  # Reset file pointer — callers re-read the stream
+
         # Check file size
-        file_size = len(content)
-        if file_size > self.max_size_bytes:
+        if oversize:
             return {
                 "valid": False,
-                "error": f"File size {file_size/1024/1024:.2f}MB exceeds maximum {settings.MAX_FILE_SIZE_MB}MB"
+                "error": f"File size exceeds maximum {settings.MAX_FILE_SIZE_MB}MB"
             }
-        
+
         # Check for empty files
         if file_size == 0:
             return {
                 "valid": False,
                 "error": "File is empty"
             }
-        
-        # MIME type validation (optional - only if magic is available)
-        if MAGIC_AVAILABLE:
+
+        # MIME type validation. A matching leading signature answers it in a
+        # few byte comparisons; anything else (including mismatches, which
+        # must still produce the precise error) goes through libmagic.
+        fast_sigs = _FAST_SIG.get(file_ext)
+        if fast_sigs is not None and header.startswith(fast_sigs):
+            pass
+        elif MAGIC_AVAILABLE:
             try:
-                mime_type = magic.from_buffer(content, mime=True)
-                
+                # libmagic only reads leading signatures — 4KB covers every
+                # format we accept, so don't hand it the whole upload
+                with _MAGIC_LOCK:
+                    mime_type = _MAGIC.from_buffer(header)
+
                 # Define allowed MIME types
                 allowed_mimes = {
                     'pdf': ['application/pdf'],
@@ -73,7 +138,7 @@ class FileValidator:
                     'doc': ['application/msword'],
                     'docx': ['application/vnd.openxmlformats-officedocument.wordprocessingml.document'],
                 }
-                
+
                 if file_ext in allowed_mimes:
                     if mime_type not in allowed_mimes[file_ext]:
                         return {
@@ -83,21 +148,11 @@ class FileValidator:
             except Exception as e:
                 # If magic fails, just log and continue (optional check)
                 print(f"MIME type check failed: {e}")
-        
-        # Basic malware check - check for suspicious patterns
-        # In production, integrate with ClamAV or similar
-        suspicious_signatures = [
-            b'<script',
-            b'javascript:',
-            b'eval(',
-        ]
-        
-        content_lower = content.lower()
-        for sig in suspicious_signatures:
-            if sig in content_lower:
-                return {
-                    "valid": False,
-                    "error": "File contains suspicious content"
-                }
-        
+
+        if suspicious:
+            return {
+                "valid": False,
+                "error": "File contains suspicious content"
+            }
+
         return {"valid": True, "error": None}
@@ -3,64 +3,62 @@ GeminiParser V2.0 — High-accuracy CV parser using Gemini 2.0 Flash.
 Single API call, optimized prompt for 95%+ accuracy.
 """
 
+import copy
+import hashlib
 import json
 import logging
 import os
+import random
 import re
 import time
+from collections import OrderedDict
+
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Dash and icon normalization are single-codepoint mappings — one C-level
+# translate pass instead of two regex substitutions over up-to-25k chars
+_CLEAN_TABLE = str.maketrans({
+    "—": "-", "–": "-",
+    "©": " ", "™": " ", "®": " ", "•": " ", "§": " ", "¶": " ",
+})
+
+# Compiled once — _clean_text and the JSON repair helpers run per parse
+_WS_RE = re.compile(r"[ \t]+")
+_MULTI_NL_RE = re.compile(r"\n{3,}")
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*")
+_BRACE_RE = re.compile(r"\{[\s\S]*\}")
+_TRAIL_COMMA_RE = re.compile(r",\s*$")
+_TRAIL_KV_RE = re.compile(r',\s*"[^"]*":\s*"?[^"}\]]*$')
+
+# Successful parses keyed by content hash — re-uploads and duplicate
+# submissions skip the multi-second API round-trip entirely. Results are
+# deep-copied in and out so cached entries can't be mutated by callers.
+# Failures are never cached (a retry may succeed).
+_RESPONSE_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_RESPONSE_CACHE_MAX = 256
+
 
 class GeminiParser:
 
     MAX_INPUT_CHARS = 25000
     API_BASE = "https://generativelanguage.googleapis.com/v1/models"
     MODEL = "gemini-2.0-flash"
+    # Part of the response-cache key — bump when PROMPT_HEAD changes so
+    # stale parses from the old prompt are never served
+    PROMPT_VERSION = "v2"
+    # Combined resume text per batched call — keeps the prompt well inside
+    # the context window and the response inside maxOutputTokens
+    MAX_BATCH_CHARS = 100_000
 
-    def __init__(self):
-        self.api_key = settings.GEMINI_API_KEY or os.getenv("GEMINI_API_KEY", "")
-        self.timeout = settings.GEMINI_TIMEOUT or 90
-        self.enabled = settings.GEMINI_ENABLED and bool(self.api_key)
-
-        if self.enabled:
-            logger.info(f"GeminiParser V2.0 initialized (model: {self.MODEL})")
-        else:
-            logger.warning("GeminiParser disabled (no API key)")
-
-    # ==========================================================
-    # PUBLIC ENTRY
-    # ==========================================================
-    def extract_sections(self, text: str) -> Dict[str, Any]:
-
-        if not self.enabled:
-            return self._empty_result()
-
-        cleaned = self._clean_text(text)
-        prompt = self._build_prompt(cleaned)
-
-        # Single Gemini call with native JSON mode
-        raw = self._call_api(prompt, retry_count=3)
-        if raw is None:
-            logger.warning("Gemini returned None — returning empty")
-            return self._empty_result()
-
-        parsed = self._safe_parse(raw)
-        if parsed is None:
-            logger.warning("Gemini extraction failed — could not parse JSON")
-            return self._empty_result()
-
-        return self._normalize(parsed)
-
-    # ==========================================================
-    # OPTIMIZED PROMPT — EXPLICIT INSTRUCTIONS FOR ACCURACY
-    # ==========================================================
-    def _build_prompt(self, text: str) -> str:
-        return f"""You are an expert ATS (Applicant Tracking System) resume parser with 99% accuracy.
+    # Static instructions + schema (~2KB) built once; per-call prompts only
+    # append the resume text instead of re-rendering the whole template
+    PROMPT_HEAD = """You are an expert ATS (Applicant Tracking System) resume parser with 99% accuracy.
 
 Your task: Extract EVERY piece of information from this resume into structured JSON.
 
@@ -87,7 +85,7 @@ IMPORTANT — COMMON MISTAKES TO AVOID:
 
 Return this exact JSON structure:
 
-{{
+{
   "name": "string",
   "email": "string or null",
   "phone": "string or null",
@@ -96,55 +94,221 @@ Return this exact JSON structure:
   "position": "string or null",
   "discipline": "string or null",
   "experience": [
-    {{
+    {
       "job_title": "string",
       "company": "string",
       "start_date": "YYYY-MM",
       "end_date": "YYYY-MM or Present",
       "description": ["string"]
-    }}
+    }
   ],
   "education": [
-    {{
+    {
       "degree": "string",
       "university": "string",
       "year": "string"
-    }}
+    }
   ],
   "projects": [
-    {{
+    {
       "project_name": "string",
       "site_name": "string or null",
       "role": "string or null",
       "duration_start": "YYYY-MM or null",
       "duration_end": "YYYY-MM or null",
       "responsibilities": ["string"]
-    }}
+    }
   ],
   "certifications": ["string"],
   "languages": [
-    {{
+    {
       "language": "string",
       "proficiency": "string (exactly as stated in CV, e.g. native, intermediate, A1.2, fluent, etc.)"
-    }}
+    }
   ],
   "skills": ["string"]
-}}
+}
 
 RESUME TEXT:
 \"\"\"
-{text}
-\"\"\""""
+"""
+
+    def __init__(self):
+        self.api_key = settings.GEMINI_API_KEY or os.getenv("GEMINI_API_KEY", "")
+        self.timeout = settings.GEMINI_TIMEOUT or 90
+        self.enabled = settings.GEMINI_ENABLED and bool(self.api_key)
+        # One session per parser: keep-alive reuses the TCP+TLS connection
+        # across calls instead of paying a fresh handshake per CV
+        self._session = requests.Session()
+
+        if self.enabled:
+            logger.info(f"GeminiParser V2.0 initialized (model: {self.MODEL})")
+        else:
+            logger.warning("GeminiParser disabled (no API key)")
+
+    # ==========================================================
+    # PUBLIC ENTRY
+    # ==========================================================
+    def extract_sections(self, text: str) -> Dict[str, Any]:
+
+        if not self.enabled:
+            return self._empty_result()
+
+        cleaned = self._clean_text(text)
+
+        # Identical cleaned text (plus model and prompt version) means an
+        # identical request — serve the cached parse instead of re-calling
+        cache_key = hashlib.sha256(
+            f"{self.MODEL}|{self.PROMPT_VERSION}|".encode() + cleaned.encode()
+        ).hexdigest()
+        hit = _RESPONSE_CACHE.get(cache_key)
+        if hit is not None:
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            logger.info("Gemini response cache hit — skipping API call")
+            return copy.deepcopy(hit)
+
+        prompt = self._build_prompt(cleaned)
+
+        # Single Gemini call with native JSON mode
+        raw = self._call_api(prompt, retry_count=3)
+        if raw is None:
+            logger.warning("Gemini returned None — returning empty")
+            return self._empty_result()
+
+        parsed = self._safe_parse(raw)
+        if parsed is None:
+            logger.warning("Gemini extraction failed — could not parse JSON")
+            return self._empty_result()
+
+        result = self._normalize(parsed)
+        _RESPONSE_CACHE[cache_key] = copy.deepcopy(result)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.popitem(last=False)
+        return result
+
+    def extract_sections_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Parse several CVs, packing them into as few API calls as possible.
+
+        Cached parses are served first; the misses are grouped under
+        MAX_BATCH_CHARS and each group goes out as one delimited prompt,
+        amortizing transport and the shared instruction prefill across the
+        batch. Any group whose response can't be matched back one-to-one
+        falls back to per-CV calls, so results are never silently crossed.
+        """
+        texts = list(texts)
+        if not self.enabled:
+            return [self._empty_result() for _ in texts]
+        if len(texts) <= 1:
+            return [self.extract_sections(t) for t in texts]
+
+        cleaned = [self._clean_text(t) for t in texts]
+        keys = [
+            hashlib.sha256(
+                f"{self.MODEL}|{self.PROMPT_VERSION}|".encode() + c.encode()
+            ).hexdigest()
+            for c in cleaned
+        ]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        misses = []
+        for i, key in enumerate(keys):
+            hit = _RESPONSE_CACHE.get(key)
+            if hit is not None:
+                _RESPONSE_CACHE.move_to_end(key)
+                results[i] = copy.deepcopy(hit)
+            else:
+                misses.append(i)
+
+        # Greedy size-bounded grouping keeps every prompt under the cap
+        groups: List[List[int]] = []
+        current: List[int] = []
+        current_len = 0
+        for i in misses:
+            if current and current_len + len(cleaned[i]) > self.MAX_BATCH_CHARS:
+                groups.append(current)
+                current, current_len = [], 0
+            current.append(i)
+            current_len += len(cleaned[i])
+        if current:
+            groups.append(current)
+
+        for group in groups:
+            rows = self._call_batch([cleaned[i] for i in group])
+            if rows is None:
+                for i in group:
+                    results[i] = self.extract_sections(texts[i])
+                continue
+            for i, row in zip(group, rows):
+                normalized = self._normalize(row)
+                _RESPONSE_CACHE[keys[i]] = copy.deepcopy(normalized)
+                if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+                    _RESPONSE_CACHE.popitem(last=False)
+                results[i] = normalized
+        return results
+
+    def _build_batch_prompt(self, cleaned_texts: List[str]) -> str:
+        # Reuse the single-CV instructions and schema; only the tail differs
+        head = self.PROMPT_HEAD[:self.PROMPT_HEAD.rfind("RESUME TEXT:")]
+        lines = [
+            head,
+            f'You will receive {len(cleaned_texts)} resumes below, each introduced by a "=== CV <n> ===" line.',
+            "Parse EACH resume independently using the rules and JSON structure above.",
+            'Return ONLY this JSON: {"results": [{"id": <n>, ...the structure above...}, ...]}',
+            'where "id" is the CV number. Return exactly one object per resume, in input order.',
+            "",
+        ]
+        for n, c in enumerate(cleaned_texts, 1):
+            lines.append(f"=== CV {n} ===")
+            lines.append(c)
+        return "\n".join(lines)
+
+    def _call_batch(self, cleaned_texts: List[str]) -> Optional[List[Dict]]:
+        """One batched call; None whenever the rows can't be trusted."""
+        raw = self._call_api(self._build_batch_prompt(cleaned_texts), retry_count=3)
+        if raw is None:
+            return None
+        parsed = self._safe_parse(raw)
+        if not isinstance(parsed, dict):
+            return None
+        rows = parsed.get("results")
+        if not isinstance(rows, list) or len(rows) != len(cleaned_texts):
+            logger.warning(
+                f"Gemini batch row mismatch: expected {len(cleaned_texts)}, "
+                f"got {len(rows) if isinstance(rows, list) else 'none'} — falling back per CV"
+            )
+            return None
+        by_id: Dict[Any, Dict] = {}
+        for pos, row in enumerate(rows):
+            if not isinstance(row, dict):
+                return None
+            by_id.setdefault(row.get("id", pos + 1), row)
+        ordered = []
+        for n in range(1, len(cleaned_texts) + 1):
+            row = by_id.get(n)
+            if row is None:
+                logger.warning(f"Gemini batch missing id {n} — falling back per CV")
+                return None
+            ordered.append(row)
+        return ordered
+
+    # ==========================================================
+    # OPTIMIZED PROMPT — EXPLICIT INSTRUCTIONS FOR ACCURACY
+    # ==========================================================
+    def _build_prompt(self, text: str) -> str:
+        return self.PROMPT_HEAD + text + '\n"""'
 
     # ==========================================================
     # CLEAN TEXT
     # ==========================================================
     def _clean_text(self, text: str) -> str:
-        text = re.sub(r"[—–]", "-", text)
-        text = re.sub(r"[©™®•§¶]", " ", text)
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        return text[:self.MAX_INPUT_CHARS].strip()
+        text = text.translate(_CLEAN_TABLE)
+        text = _WS_RE.sub(" ", text)
+        text = _MULTI_NL_RE.sub("\n\n", text)
+        if len(text) > self.MAX_INPUT_CHARS:
+            # Truncate at a line boundary so the tail isn't a half-sentence
+            # that skews what the model extracts from the last section
+            cut = text.rfind("\n", 0, self.MAX_INPUT_CHARS)
+            text = text[:cut if cut > 0 else self.MAX_INPUT_CHARS]
+        return text.strip()
 
     # ==========================================================
     # API CALL — WITH RETRY
@@ -164,12 +328,15 @@ RESUME TEXT:
         for attempt in range(1, retry_count + 1):
             try:
                 start_time = time.time()
-                resp = requests.post(url, json=payload, timeout=self.timeout)
+                resp = self._session.post(url, json=payload, timeout=self.timeout)
                 elapsed = round(time.time() - start_time, 1)
 
                 if resp.status_code == 429:
-                    wait = 5 * attempt
-                    logger.warning(f"Gemini 429 rate limit — waiting {wait}s (attempt {attempt}/{retry_count})")
+                    # Exponential backoff with full jitter: concurrent
+                    # workers that hit the limit together spread out their
+                    # retries instead of re-colliding on a fixed schedule
+                    wait = random.uniform(1, min(30, 2 ** (attempt + 1)))
+                    logger.warning(f"Gemini 429 rate limit — waiting {wait:.1f}s (attempt {attempt}/{retry_count})")
                     time.sleep(wait)
                     continue
 
@@ -217,14 +384,14 @@ RESUME TEXT:
         text = raw.strip()
 
         # Strip markdown code block if present (shouldn't happen with JSON mode)
-        code_block = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
+        code_block = _CODE_BLOCK_RE.search(text)
         if code_block:
             text = code_block.group(1).strip()
         elif text.startswith("```"):
-            text = re.sub(r"^```(?:json)?\s*", "", text).strip()
+            text = _CODE_FENCE_RE.sub("", text).strip()
 
         # Extract JSON object
-        brace = re.search(r"\{[\s\S]*\}", text)
+        brace = _BRACE_RE.search(text)
         if brace:
             text = brace.group(0)
 
@@ -256,8 +423,8 @@ RESUME TEXT:
             return None
 
         # Remove trailing incomplete key-value pairs
-        text = re.sub(r",\s*$", "", text.rstrip())
-        text = re.sub(r',\s*"[^"]*":\s*"?[^"}\]]*$', "", text)
+        text = _TRAIL_COMMA_RE.sub("", text.rstrip())
+        text = _TRAIL_KV_RE.sub("", text)
         text += "]" * open_brackets
         text += "}" * open_braces
 
@@ -267,64 +434,65 @@ RESUME TEXT:
     # NORMALIZE OUTPUT
     # ==========================================================
     def _normalize(self, data: Dict) -> Dict:
-        result = {
+        # Comprehensions with an upfront isinstance filter — one append-free
+        # pass per section. The `or None` / `or []` coercions are load-bearing:
+        # they squash ""/0/{} from the model into the shapes callers expect.
+        raw_certs = data.get("certifications") or []
+        raw_skills = data.get("skills") or []
+        return {
             "name": data.get("name") or None,
             "summary": data.get("summary") or None,
             "position": data.get("position") or None,
             "discipline": data.get("discipline") or None,
-            "experience": [],
-            "education": [],
-            "projects": [],
-            "certifications": [],
-            "skills": [],
-        }
-
-        for exp in (data.get("experience") or []):
-            if isinstance(exp, dict):
-                result["experience"].append({
+            "experience": [
+                {
                     "job_title": exp.get("job_title") or None,
                     "company": exp.get("company") or None,
                     "start_date": exp.get("start_date") or None,
                     "end_date": exp.get("end_date") or None,
                     "description": exp.get("description") or [],
-                })
-
-        for edu in (data.get("education") or []):
-            if isinstance(edu, dict):
-                result["education"].append({
+                }
+                for exp in (data.get("experience") or [])
+                if isinstance(exp, dict)
+            ],
+            "education": [
+                {
                     "degree": edu.get("degree") or None,
                     "university": edu.get("university") or None,
                     "year": edu.get("year") or None,
-                })
-
-        for proj in (data.get("projects") or []):
-            if isinstance(proj, dict):
-                result["projects"].append({
+                }
+                for edu in (data.get("education") or [])
+                if isinstance(edu, dict)
+            ],
+            "projects": [
+                {
                     "project_name": proj.get("project_name") or None,
                     "site_name": proj.get("site_name") or None,
                     "role": proj.get("role") or None,
                     "responsibilities": proj.get("responsibilities") or [],
                     "duration_start": proj.get("duration_start") or None,
                     "duration_end": proj.get("duration_end") or None,
-                })
-
-        raw_certs = data.get("certifications") or []
-        if isinstance(raw_certs, list):
-            result["certifications"] = [c for c in raw_certs if isinstance(c, str)]
-
-        result["languages"] = []
-        for lang in (data.get("languages") or []):
-            if isinstance(lang, dict):
-                result["languages"].append({
+                }
+                for proj in (data.get("projects") or [])
+                if isinstance(proj, dict)
+            ],
+            "certifications": (
+                [c for c in raw_certs if isinstance(c, str)]
+                if isinstance(raw_certs, list) else []
+            ),
+            "languages": [
+                {
                     "language": lang.get("language") or None,
                     "proficiency": lang.get("proficiency") or "Not Specified",
-                })
-
-        raw_skills = data.get("skills") or []
-        if isinstance(raw_skills, list):
-            result["skills"] = [s for s in raw_skills if isinstance(s, str)]
-
-        return result
+                }
+                for lang in (data.get("languages") or [])
+                if isinstance(lang, dict)
+            ],
+            "skills": (
+                [s for s in raw_skills if isinstance(s, str)]
+                if isinstance(raw_skills, list) else []
+            ),
+        }
 
     # ==========================================================
     # EMPTY RESULT
@@ -344,23 +512,38 @@ RESUME TEXT:
         }
 
 
+# ------------------------------------------------------------------
+# SHARED INSTANCE
+# ------------------------------------------------------------------
+# Settings are process-wide and the response cache already lives at module
+# level, so every caller can share one parser — and with it one keep-alive
+# session pool — instead of paying init and a fresh TLS handshake per parse.
+_SHARED_PARSER: Optional[GeminiParser] = None
+
+
+def get_shared_parser() -> GeminiParser:
+    """Return the process-wide GeminiParser, creating it on first use."""
+    global _SHARED_PARSER
+    if _SHARED_PARSER is None:
+        _SHARED_PARSER = GeminiParser()
+    return _SHARED_PARSER
+
+
 # ------------------------------------------------------------------
 # CONFIDENCE SCORING
 # ------------------------------------------------------------------
 def calculate_confidence(merged: Dict[str, Any]) -> int:
-    score = 0
-    if merged.get("name"):
-        score += 10
-    if merged.get("summary") and len(merged["summary"]) > 20:
-        score += 15
-    if len(merged.get("experience") or []) > 0:
-        score += 25
-    if len(merged.get("experience") or []) >= 3:
-        score += 10
-    if len(merged.get("projects") or []) > 0:
-        score += 15
-    if len(merged.get("skills") or []) > 3:
-        score += 15
-    if merged.get("education"):
-        score += 10
+    """Score 0-100 from field presence: name 10, summary >20 chars 15,
+    any experience 25 (+10 at three entries), projects 15, >3 skills 15,
+    education 10. Branchless bool arithmetic — one expression, no jumps."""
+    exp_n = len(merged.get("experience") or ())
+    score = (
+        10 * bool(merged.get("name"))
+        + 15 * (len(merged.get("summary") or "") > 20)
+        + 25 * (exp_n > 0)
+        + 10 * (exp_n >= 3)
+        + 15 * (len(merged.get("projects") or ()) > 0)
+        + 15 * (len(merged.get("skills") or ()) > 3)
+        + 10 * bool(merged.get("education"))
+    )
     return min(score, 100)
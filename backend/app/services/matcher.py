@@ -12,28 +12,112 @@ from app.models.match_result import MatchResult
 from app.services.dictionaries import get_role_equivalents
 
 
+class JDIndex:
+    """Precomputed lowercase views of one JD's requirement lists.
+
+    Scoring a batch of candidates re-reads the same JD fields for every
+    candidate; building the sets once here makes the per-candidate work
+    pure set intersections instead of N redundant lower()/set() passes.
+    """
+
+    __slots__ = ('must_have', 'nice_to_have', 'required_tools', 'role_keywords', 'jd_keywords')
+
+    def __init__(self, jd: JobDescription):
+        self.must_have = frozenset(s.lower() for s in (jd.must_have_skills or []))
+        self.nice_to_have = frozenset(s.lower() for s in (jd.nice_to_have_skills or []))
+        self.required_tools = frozenset(t.lower() for t in (jd.required_tools or []))
+        self.role_keywords = tuple(r.lower() for r in (jd.role_keywords or []))
+        # Deduplicated — a skill that is also a role keyword is scanned (and
+        # counted toward the portfolio ratio) once, not twice
+        self.jd_keywords = tuple(dict.fromkeys(
+            self.role_keywords + tuple(s.lower() for s in (jd.must_have_skills or []))
+        ))
+
+
+class _CandidateView:
+    """Lazily-built lowercase views of one candidate's lists.
+
+    A candidate matched against several JDs re-lowered its skills and tools
+    for every pair; this is built once per candidate and parked on the ORM
+    object, so repeat scorings are attribute reads.
+    """
+
+    __slots__ = ('skills', 'tools', 'text_lower')
+
+    def __init__(self, candidate: Candidate):
+        self.skills = frozenset(s.lower() for s in (candidate.skills or []))
+        self.tools = frozenset(t.lower() for t in (candidate.tools or []))
+        self.text_lower = (candidate.raw_text or '').lower()
+
+
+def _candidate_view(candidate: Candidate) -> _CandidateView:
+    """Return the candidate's cached lowercase view, building it on first use."""
+    view = getattr(candidate, '_match_view', None)
+    if view is None:
+        view = _CandidateView(candidate)
+        candidate._match_view = view
+    return view
+
+
 class CandidateMatcher:
     """Rule-based matching engine for candidate-JD matching."""
-    
+
     def __init__(self):
-        self.role_equivalents = get_role_equivalents()
-    
+        # Lowercase the equivalence table once so the per-candidate inner
+        # loop is pure C-level substring tests, no repeated lower() calls
+        self.role_equivalents = {
+            k.lower(): tuple(e.lower() for e in v)
+            for k, v in get_role_equivalents().items()
+        }
+
+    def build_jd_index(self, jd: JobDescription) -> JDIndex:
+        """Build the reusable lowercase index for one JD. Callers matching
+        many candidates should build this once and pass it to each
+        match_candidate call."""
+        return JDIndex(jd)
+
+    def match_batch(
+        self,
+        candidates: List[Candidate],
+        jd: JobDescription,
+        db: Session
+    ) -> List[MatchResult]:
+        """Match many candidates against one JD.
+
+        Builds the JD index once so the per-candidate loop does only the
+        candidate-side work; results come back in input order.
+        """
+        jd_index = JDIndex(jd)
+        return [self.match_candidate(c, jd, db, jd_index) for c in candidates]
+
     def match_candidate(
         self,
         candidate: Candidate,
         jd: JobDescription,
-        db: Session
+        db: Session,
+        jd_index: JDIndex = None
     ) -> MatchResult:
         """
         Match a candidate against a job description.
         Returns a MatchResult with explainable scoring.
         """
+        if jd_index is None:
+            jd_index = JDIndex(jd)
+
+        # One pass over the CV text finds every present JD keyword; the role
+        # and portfolio scorers both read from this set instead of scanning
+        # the text separately
+        text_lower = _candidate_view(candidate).text_lower
+        matched_keywords = frozenset(
+            kw for kw in jd_index.jd_keywords if kw in text_lower
+        )
+
         # Calculate individual scores
-        skill_score = self._calculate_skill_score(candidate, jd)
-        role_score = self._calculate_role_score(candidate, jd)
-        tool_score = self._calculate_tool_score(candidate, jd)
+        skill_score = self._calculate_skill_score(candidate, jd, jd_index)
+        role_score = self._calculate_role_score(candidate, jd, jd_index, matched_keywords)
+        tool_score = self._calculate_tool_score(candidate, jd, jd_index)
         experience_score = self._calculate_experience_score(candidate, jd)
-        portfolio_score = self._calculate_portfolio_score(candidate, jd)
+        portfolio_score = self._calculate_portfolio_score(candidate, jd, jd_index, matched_keywords)
         quality_score = self._calculate_quality_score(candidate, jd)
         
         # Calculate total weighted score
@@ -86,15 +170,16 @@ class CandidateMatcher:
     def _calculate_skill_score(
         self,
         candidate: Candidate,
-        jd: JobDescription
+        jd: JobDescription,
+        jd_index: JDIndex
     ) -> Dict:
         """
         Calculate skills match score (max: jd.skill_weight points).
         Simple proportional: (matched/total) × max_points
         """
-        candidate_skills = set([s.lower() for s in (candidate.skills or [])])
-        must_have = set([s.lower() for s in jd.must_have_skills])
-        nice_to_have = set([s.lower() for s in (jd.nice_to_have_skills or [])])
+        candidate_skills = _candidate_view(candidate).skills
+        must_have = jd_index.must_have
+        nice_to_have = jd_index.nice_to_have
         
         # Match must-have skills
         matched_must_have = candidate_skills & must_have
@@ -149,52 +234,53 @@ class CandidateMatcher:
     def _calculate_role_score(
         self,
         candidate: Candidate,
-        jd: JobDescription
+        jd: JobDescription,
+        jd_index: JDIndex,
+        matched_keywords: frozenset
     ) -> Dict:
         """
         Calculate role/title match score (max: jd.role_weight points).
         """
         max_points = jd.role_weight
-        
-        if not jd.role_keywords:
+
+        if not jd_index.role_keywords:
             return {'weighted': max_points, 'max': max_points, 'match_type': 'no_requirements'}
-        
-        candidate_text = (candidate.raw_text or '').lower()
-        experience = candidate.experience or []
-        
-        # Check for exact or equivalent role matches
-        role_keywords_lower = [r.lower() for r in jd.role_keywords]
-        
-        for keyword in role_keywords_lower:
+
+        candidate_text = _candidate_view(candidate).text_lower
+
+        # Check for exact or equivalent role matches; exact hits come from
+        # the shared keyword set, only equivalents still scan the text
+        for keyword in jd_index.role_keywords:
             # Exact match
-            if keyword in candidate_text:
+            if keyword in matched_keywords:
                 return {'weighted': max_points, 'max': max_points, 'match_type': 'exact'}
-            
+
             # Check equivalents
             if keyword in self.role_equivalents:
                 for equiv in self.role_equivalents[keyword]:
-                    if equiv.lower() in candidate_text:
+                    if equiv in candidate_text:
                         return {'weighted': max_points * 0.75, 'max': max_points, 'match_type': 'equivalent'}
-        
+
         # No match
         return {'weighted': 0, 'max': max_points, 'match_type': 'no_match'}
     
     def _calculate_tool_score(
         self,
         candidate: Candidate,
-        jd: JobDescription
+        jd: JobDescription,
+        jd_index: JDIndex
     ) -> Dict:
         """
         Calculate software/tool match score (max: jd.tool_weight points).
         Simple proportional: (matched/total) × max_points
         """
         max_points = jd.tool_weight
-        
-        if not jd.required_tools:
+
+        if not jd_index.required_tools:
             return {'weighted': max_points, 'max': max_points, 'matched': []}
-        
-        candidate_tools = set([t.lower() for t in (candidate.tools or [])])
-        required_tools = set([t.lower() for t in jd.required_tools])
+
+        candidate_tools = _candidate_view(candidate).tools
+        required_tools = jd_index.required_tools
         
         matched_tools = candidate_tools & required_tools
         missing_tools = required_tools - candidate_tools
@@ -248,21 +334,20 @@ class CandidateMatcher:
     def _calculate_portfolio_score(
         self,
         candidate: Candidate,
-        jd: JobDescription
+        jd: JobDescription,
+        jd_index: JDIndex,
+        matched_keywords: frozenset
     ) -> Dict:
         """
         Calculate portfolio relevance score (max: jd.portfolio_weight points).
         """
         max_points = jd.portfolio_weight
-        
+
         portfolio_urls = candidate.portfolio_urls or []
-        raw_text = (candidate.raw_text or '').lower()
-        
-        # Check for JD keywords in portfolio/raw text
-        jd_keywords = (jd.role_keywords or []) + (jd.must_have_skills or [])
-        jd_keywords_lower = [k.lower() for k in jd_keywords]
-        
-        keyword_matches = sum(1 for kw in jd_keywords_lower if kw in raw_text)
+
+        # JD keyword hits come from the shared per-candidate scan
+        jd_keywords = jd_index.jd_keywords
+        keyword_matches = len(matched_keywords)
         
         # VERY GENEROUS: assume good portfolio if keywords match
         score = 0
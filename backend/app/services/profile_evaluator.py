@@ -3,15 +3,21 @@ ProfileEvaluator — Recruitment Intelligence Engine.
 Computes derived metrics from extracted CV data.
 """
 
+import bisect
+import functools
+import itertools
 import logging
 import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Keyword lists are stored pre-lowercased as immutable tuples; the scans
+# below compare against already-lowered text, so no per-call .lower()
+
 # GCC countries and city keywords
-GCC_KEYWORDS = [
+GCC_KEYWORDS = (
     "uae", "dubai", "abu dhabi", "sharjah", "ajman", "ras al khaimah", "fujairah",
     "saudi", "ksa", "riyadh", "jeddah", "mecca", "medina", "dammam", "neom",
     "qatar", "doha", "lusail",
@@ -19,10 +25,10 @@ GCC_KEYWORDS = [
     "bahrain", "manama",
     "kuwait", "kuwait city",
     "gcc",
-]
+)
 
 # Known MNC companies in engineering/construction
-MNC_COMPANIES = [
+MNC_COMPANIES = (
     "aecom", "wsp", "jacobs", "atkins", "snc lavalin", "snc-lavalin",
     "bechtel", "fluor", "kbr", "worley", "parsons", "arcadis", "stantec",
     "arup", "mott macdonald", "hdr", "turner", "skanska", "vinci",
@@ -31,17 +37,91 @@ MNC_COMPANIES = [
     "dar al handasah", "khatib & alami", "consolidated contractors",
     "arabtec", "al habtoor", "emaar", "nakheel", "aldar",
     "saudi binladin", "al rajhi", "al bawani",
-]
+)
 
 # Known software/tools in engineering
-KNOWN_SOFTWARE = [
+KNOWN_SOFTWARE = (
     "revit", "autocad", "navisworks", "tekla", "etabs", "sap2000", "staad",
     "primavera", "ms project", "procore", "bluebeam", "sketchup",
     "civil 3d", "infraworks", "robot structural", "safe", "dynamo",
     "bim 360", "acc", "solibri", "bentley", "microstation",
     "archicad", "rhino", "grasshopper", "enscape", "lumion",
     "matlab", "python", "excel", "powerbi", "power bi",
-]
+)
+
+# Seniority bands: years below each threshold map to the label at its index
+_SENIORITY_THRESHOLDS = (2, 5, 8, 12)
+_SENIORITY_LABELS = ("Junior", "Mid-Level", "Senior", "Lead", "Manager")
+
+# Software that counts toward portfolio relevancy (exact skill match)
+_RELEVANT_SOFTWARE = frozenset(
+    {"revit", "autocad", "navisworks", "tekla", "etabs", "primavera"}
+)
+
+
+# Multi-pattern scans — one compiled alternation walks the text once
+# instead of one substring search per keyword
+_GCC_RE = re.compile("|".join(map(re.escape, GCC_KEYWORDS)))
+_MNC_RE = re.compile("|".join(map(re.escape, MNC_COMPANIES)))
+
+# Domains that count toward portfolio relevancy
+_DOMAIN_KEYWORDS = (
+    "civil", "structural", "architecture", "bim", "mep",
+    "construction", "infrastructure", "engineering",
+)
+_DOMAIN_RE = re.compile("|".join(map(re.escape, _DOMAIN_KEYWORDS)))
+
+# Date parsing — compiled once; _parse_date runs twice per experience row
+_PRESENT_TOKENS = frozenset(("present", "current", "now"))
+_YM_RE = re.compile(r"^(\d{4})-(\d{1,2})$")
+_MONTH_YEAR_RE = re.compile(
+    r"^(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
+    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|"
+    r"Dec(?:ember)?)\s+(\d{4})$",
+    re.IGNORECASE,
+)
+_YEAR_ONLY_RE = re.compile(r"^(\d{4})$")
+_MONTH_MAP = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+# Every token _MONTH_YEAR_RE accepts, mapped straight to its month number
+_MONTH_TOKENS = {
+    "january": 1, "february": 2, "march": 3, "april": 4, "may": 5,
+    "june": 6, "july": 7, "august": 8, "sept": 9, "september": 9,
+    "october": 10, "november": 11, "december": 12,
+    **_MONTH_MAP,
+}
+_PUNCT_RE = re.compile(r"[.,;:]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_static_date(date_str: str) -> Optional[datetime]:
+    """Parse a fixed date string (YYYY-MM, Month YYYY, YYYY) or return None.
+    Cached — the same handful of years and months recurs across a batch."""
+    # YYYY-MM
+    match = _YM_RE.match(date_str)
+    if match:
+        return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+    # Month YYYY (e.g., "January 2020", "Jan 2020") — dict lookup first,
+    # regex only for inputs the split doesn't settle
+    parts = date_str.split()
+    if len(parts) == 2:
+        month = _MONTH_TOKENS.get(parts[0].lower())
+        if month and len(parts[1]) == 4 and parts[1].isdigit():
+            return datetime(int(parts[1]), month, 1)
+    match = _MONTH_YEAR_RE.match(date_str)
+    if match:
+        month_str = match.group(1)[:3].lower()
+        return datetime(int(match.group(2)), _MONTH_MAP.get(month_str, 1), 1)
+
+    # Just YYYY
+    match = _YEAR_ONLY_RE.match(date_str)
+    if match:
+        return datetime(int(match.group(1)), 1, 1)
+
+    return None
 
 
 class ProfileEvaluator:
@@ -54,10 +134,19 @@ class ProfileEvaluator:
         tools = extracted_data.get("tools") or []
         summary = extracted_data.get("summary") or ""
 
-        all_skills = list(set(s.lower() for s in skills + tools))
+        all_skills = {s.lower() for s in itertools.chain(skills, tools)}
 
-        total_years = self.calculate_total_experience(experience)
-        gcc_years = self.calculate_gcc_experience(experience, projects)
+        # One clock read per CV; every "Present" end date resolves to it.
+        # Total and GCC months come out of a single pass over experience,
+        # scanning a lowercased haystack built once per entry.
+        now = datetime.now()
+        exp_haystacks = [self._exp_haystack(e) for e in experience]
+        total_months, gcc_months = self._aggregate_experience(
+            experience, now, haystacks=exp_haystacks
+        )
+        gcc_months += self._project_gcc_months(projects, now)
+        total_years = round(total_months / 12, 1)
+        gcc_years = round(gcc_months / 12, 1)
         seniority = self.determine_seniority(total_years)
         mnc = self.detect_mnc_experience(experience)
         software_exp = self.calculate_software_experience(all_skills, experience)
@@ -73,83 +162,91 @@ class ProfileEvaluator:
     # ------------------------------------------------------------------
     # 1) TOTAL EXPERIENCE
     # ------------------------------------------------------------------
-    def calculate_total_experience(self, experience_list: List[Dict]) -> float:
+    def calculate_total_experience(
+        self, experience_list: List[Dict], now: Optional[datetime] = None
+    ) -> float:
         """Sum durations from start_date to end_date. Returns years rounded to 1 decimal."""
-        total_months = 0
+        if now is None:
+            now = datetime.now()
+        total_months, _ = self._aggregate_experience(experience_list, now)
+        return round(total_months / 12, 1)
 
-        for exp in experience_list:
-            start = self._parse_date(exp.get("start_date"))
-            end = self._parse_date(exp.get("end_date"))
+    # ------------------------------------------------------------------
+    # 2) GCC EXPERIENCE
+    # ------------------------------------------------------------------
+    def calculate_gcc_experience(
+        self,
+        experience_list: List[Dict],
+        projects_list: List[Dict],
+        now: Optional[datetime] = None,
+    ) -> float:
+        """Count years worked in GCC region based on company/description/project locations."""
+        if now is None:
+            now = datetime.now()
+        _, gcc_months = self._aggregate_experience(experience_list, now)
+        gcc_months += self._project_gcc_months(projects_list, now)
+        return round(gcc_months / 12, 1)
 
+    def _aggregate_experience(
+        self,
+        experience_list: List[Dict],
+        now: datetime,
+        haystacks: Optional[List[str]] = None,
+    ) -> tuple:
+        """Single pass over experience: parse each entry's dates once and
+        accumulate (total_months, gcc_months) together."""
+        total_months = 0
+        gcc_months = 0
+
+        for i, exp in enumerate(experience_list):
+            start = self._parse_date(exp.get("start_date"), now=now)
             if start is None:
                 continue
+            end = self._parse_date(exp.get("end_date"), now=now)
             if end is None:
-                end = datetime.now()
-
+                end = now
             diff_months = (end.year - start.year) * 12 + (end.month - start.month)
             if diff_months > 0:
                 total_months += diff_months
+                text = haystacks[i] if haystacks is not None else self._exp_haystack(exp)
+                if _GCC_RE.search(text):
+                    gcc_months += diff_months
 
-        return round(total_months / 12, 1)
+        return total_months, gcc_months
 
-    # ------------------------------------------------------------------
-    # 2) GCC EXPERIENCE
-    # ------------------------------------------------------------------
-    def calculate_gcc_experience(
-        self, experience_list: List[Dict], projects_list: List[Dict]
-    ) -> float:
-        """Count years worked in GCC region based on company/description/project locations."""
+    def _project_gcc_months(self, projects_list: List[Dict], now: datetime) -> int:
+        """Months from GCC-referencing projects; only counted when both dates parse."""
         gcc_months = 0
 
-        for exp in experience_list:
-            if self._has_gcc_reference(exp):
-                start = self._parse_date(exp.get("start_date"))
-                end = self._parse_date(exp.get("end_date"))
-                if start is None:
-                    continue
-                if end is None:
-                    end = datetime.now()
-                diff = (end.year - start.year) * 12 + (end.month - start.month)
-                if diff > 0:
-                    gcc_months += diff
-
-        # Also check projects for GCC references (add 6 months per GCC project if no dates)
         for proj in projects_list:
             text = " ".join([
                 proj.get("site_name") or "",
                 proj.get("project_name") or "",
                 " ".join(proj.get("responsibilities") or []),
             ]).lower()
-            if any(k in text for k in GCC_KEYWORDS):
-                start = self._parse_date(proj.get("duration_start"))
-                end = self._parse_date(proj.get("duration_end"))
+            if _GCC_RE.search(text):
+                start = self._parse_date(proj.get("duration_start"), now=now)
+                end = self._parse_date(proj.get("duration_end"), now=now)
                 if start and end:
                     diff = (end.year - start.year) * 12 + (end.month - start.month)
                     if diff > 0:
                         gcc_months += diff
 
-        return round(gcc_months / 12, 1)
+        return gcc_months
 
     # ------------------------------------------------------------------
     # 3) SENIORITY LEVEL
     # ------------------------------------------------------------------
     def determine_seniority(self, total_years: float) -> str:
-        if total_years < 2:
-            return "Junior"
-        elif total_years < 5:
-            return "Mid-Level"
-        elif total_years < 8:
-            return "Senior"
-        elif total_years < 12:
-            return "Lead"
-        else:
-            return "Manager"
+        return _SENIORITY_LABELS[
+            bisect.bisect_right(_SENIORITY_THRESHOLDS, total_years)
+        ]
 
     # ------------------------------------------------------------------
     # 4) SOFTWARE EXPERIENCE
     # ------------------------------------------------------------------
     def calculate_software_experience(
-        self, skills: List[str], experience_list: List[Dict]
+        self, skills: Iterable[str], experience_list: List[Dict]
     ) -> Dict[str, Dict[str, Any]]:
         """
         List software found in the candidate's skills.
@@ -157,9 +254,11 @@ class ProfileEvaluator:
         """
         software_found: Dict[str, Dict[str, Any]] = {}
 
+        # One joined haystack; each keyword is a single C-level substring
+        # search instead of a Python loop over every skill string
+        haystack = "\n".join(skills)
         for sw in KNOWN_SOFTWARE:
-            sw_lower = sw.lower()
-            if not any(sw_lower in s for s in skills):
+            if sw not in haystack:
                 continue
 
             software_found[sw] = {
@@ -173,11 +272,12 @@ class ProfileEvaluator:
     # 5) MNC EXPERIENCE
     # ------------------------------------------------------------------
     def detect_mnc_experience(self, experience_list: List[Dict]) -> bool:
-        for exp in experience_list:
-            company = (exp.get("company") or "").lower()
-            if any(mnc in company for mnc in MNC_COMPANIES):
-                return True
-        return False
+        # One scan over all companies; the newline separator keeps a name
+        # from matching across two entries
+        companies = "\n".join(
+            (exp.get("company") or "").lower() for exp in experience_list
+        )
+        return _MNC_RE.search(companies) is not None
 
     # ------------------------------------------------------------------
     # 6) PORTFOLIO RELEVANCY SCORE
@@ -193,20 +293,16 @@ class ProfileEvaluator:
         score = 0
 
         # Relevant domain match (+30)
-        domain_keywords = [
-            "civil", "structural", "architecture", "bim", "mep",
-            "construction", "infrastructure", "engineering",
-        ]
-        all_text = " ".join(
-            (exp.get("job_title") or "") + " " + " ".join(exp.get("description") or [])
-            for exp in experience
-        ).lower()
-        if any(k in all_text for k in domain_keywords):
+        parts = []
+        for exp in experience:
+            parts.append(exp.get("job_title") or "")
+            parts.extend(exp.get("description") or [])
+        all_text = " ".join(parts).lower()
+        if _DOMAIN_RE.search(all_text):
             score += 30
 
         # Relevant software match (+30)
-        relevant_software = ["revit", "autocad", "navisworks", "tekla", "etabs", "primavera"]
-        if any(sw in skills for sw in relevant_software):
+        if not _RELEVANT_SOFTWARE.isdisjoint(skills):
             score += 30
 
         # GCC experience (+20)
@@ -227,10 +323,10 @@ class ProfileEvaluator:
             return "Intermediate"
 
         words = summary.split()
-        avg_word_len = sum(len(w) for w in words) / max(len(words), 1)
+        avg_word_len = sum(map(len, words)) / max(len(words), 1)
 
         # Well-structured: has enough words, decent avg word length, has punctuation
-        has_punctuation = bool(re.search(r"[.,;:]", summary))
+        has_punctuation = bool(_PUNCT_RE.search(summary))
         long_enough = len(words) >= 15
 
         if long_enough and avg_word_len >= 4 and has_punctuation:
@@ -240,52 +336,31 @@ class ProfileEvaluator:
     # ------------------------------------------------------------------
     # HELPERS
     # ------------------------------------------------------------------
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
+    def _parse_date(
+        self, date_str: Optional[str], now: Optional[datetime] = None
+    ) -> Optional[datetime]:
         """Parse date string into datetime. Handles YYYY-MM, YYYY, Month YYYY, Present."""
         if not date_str:
             return None
 
         date_str = date_str.strip()
 
-        if date_str.lower() in ("present", "current", "now"):
-            return datetime.now()
-
-        # YYYY-MM
-        match = re.match(r"^(\d{4})-(\d{1,2})$", date_str)
-        if match:
-            return datetime(int(match.group(1)), int(match.group(2)), 1)
-
-        # Month YYYY (e.g., "January 2020", "Jan 2020")
-        match = re.match(
-            r"^(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
-            r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|"
-            r"Dec(?:ember)?)\s+(\d{4})$",
-            date_str,
-            re.IGNORECASE,
-        )
-        if match:
-            month_map = {
-                "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-                "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-            }
-            month_str = match.group(1)[:3].lower()
-            return datetime(int(match.group(2)), month_map.get(month_str, 1), 1)
+        if date_str.lower() in _PRESENT_TOKENS:
+            return now if now is not None else datetime.now()
 
-        # Just YYYY
-        match = re.match(r"^(\d{4})$", date_str)
-        if match:
-            return datetime(int(match.group(1)), 1, 1)
+        return _parse_static_date(date_str)
 
-        return None
-
-    def _has_gcc_reference(self, exp: Dict) -> bool:
-        """Check if experience entry references GCC region."""
-        text = " ".join([
+    def _exp_haystack(self, exp: Dict) -> str:
+        """Lowercased company/title/description text for keyword scans."""
+        return " ".join([
             exp.get("company") or "",
             exp.get("job_title") or "",
             " ".join(exp.get("description") or []),
         ]).lower()
-        return any(k in text for k in GCC_KEYWORDS)
+
+    def _has_gcc_reference(self, exp: Dict) -> bool:
+        """Check if experience entry references GCC region."""
+        return _GCC_RE.search(self._exp_haystack(exp)) is not None
 
     def _get_proficiency(self, years: float) -> str:
         """Kept for backward compatibility."""
@@ -2,9 +2,17 @@
 Celery tasks for OCR processing.
 These can be used in production instead of FastAPI BackgroundTasks.
 """
+import logging
+
 from celery import shared_task
 from app.workers.celery_app import celery_app
 
+logger = logging.getLogger(__name__)
+
+# Persist batch progress every N files so status polling sees movement
+# without paying a commit (fsync) per file
+COMMIT_EVERY = 50
+
 
 @celery_app.task(name="process_cv_batch")
 def process_cv_batch(batch_id: str, file_paths: list):
@@ -15,15 +23,17 @@ def process_cv_batch(batch_id: str, file_paths: list):
         batch_id: Batch UUID
         file_paths: List of file paths to process
     """
+    import os
     from app.database import SessionLocal
     from app.models.batch import Batch, BatchStatus
     from app.services.ocr_pipeline import OCRPipeline
+    from concurrent.futures import ThreadPoolExecutor
     from datetime import datetime
     
     db = SessionLocal()
     try:
-        # Get batch
-        batch = db.query(Batch).filter(Batch.batch_id == batch_id).first()
+        # Get batch — primary-key lookup, so skip Query construction entirely
+        batch = db.get(Batch, batch_id)
         if not batch:
             return {"status": "error", "message": "Batch not found"}
         
@@ -31,18 +41,37 @@ def process_cv_batch(batch_id: str, file_paths: list):
         batch.status = BatchStatus.PROCESSING
         db.commit()
         
-        # Process files
+        # Process files — counters accumulate in memory and land together
+        # with the final status in one commit, instead of a round-trip and
+        # fsync per file.
+        #
+        # A small thread pool OCRs several files at once — tesseract runs as
+        # a subprocess, so the GIL is not a bottleneck — and each result lands
+        # in the content-hash cache. The main thread then walks the files in
+        # order; process_file's own extract_text call is a cache read. The DB
+        # session never leaves this thread. Capped at four workers so that,
+        # combined with the per-page pool inside the pipeline, we don't
+        # oversubscribe the host.
         pipeline = OCRPipeline()
-        for file_path in file_paths:
-            try:
-                result = pipeline.process_file(file_path, batch_id, db)
-                batch.processed_files += 1
-                db.commit()
-            except Exception as e:
-                print(f"Error processing {file_path}: {e}")
-                batch.failed_files += 1
-                db.commit()
-        
+        ocr_workers = min(len(file_paths), 4, os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=ocr_workers) as pool:
+            ocr_futures = [pool.submit(pipeline.extract_text, fp) for fp in file_paths]
+            for i, (file_path, future) in enumerate(zip(file_paths, ocr_futures), 1):
+                try:
+                    future.result()
+                except Exception:
+                    pass  # process_file below surfaces the real error
+                try:
+                    # commit=False: this loop owns the transaction boundary,
+                    # so candidates and counters land together at checkpoints
+                    result = pipeline.process_file(file_path, batch_id, db, commit=False)
+                    batch.processed_files += 1
+                except Exception as e:
+                    logger.warning("Error processing %s: %s", file_path, e)
+                    batch.failed_files += 1
+                if i % COMMIT_EVERY == 0:
+                    db.commit()
+
         # Mark batch as completed
         batch.status = BatchStatus.COMPLETED
         batch.completed_at = datetime.utcnow()
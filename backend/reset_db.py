@@ -30,20 +30,16 @@ def reset_database():
         print("❌ Aborted. No changes made.")
         return
     
-    print("\n🗑️  Dropping all tables...")
+    print("\n🗑️  Dropping and recreating all tables...")
     try:
-        Base.metadata.drop_all(bind=engine)
-        print("✅ All tables dropped successfully")
+        # One transaction for the whole DDL batch: a single commit instead of
+        # one per statement, and a failed recreate rolls back the drops too
+        with engine.begin() as conn:
+            Base.metadata.drop_all(bind=conn)
+            Base.metadata.create_all(bind=conn)
+        print("✅ All tables dropped and recreated successfully")
     except Exception as e:
-        print(f"❌ Error dropping tables: {e}")
-        return
-    
-    print("\n🔨 Creating tables with new schema...")
-    try:
-        Base.metadata.create_all(bind=engine)
-        print("✅ All tables created successfully")
-    except Exception as e:
-        print(f"❌ Error creating tables: {e}")
+        print(f"❌ Error resetting tables: {e}")
         return
     
     print("\n✨ Database reset complete!")